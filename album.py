@@ -0,0 +1,101 @@
+# album.py
+"""Sprite-sheet rendering of the sticker album.
+
+Each position group is drawn as one pre-composited sprite plus one HTML grid,
+instead of one st.image and one st.button per player. Build the sprites
+ahead of time with ``python album.py``; they are written to Streamlit's
+static folder (see .streamlit/config.toml) so browsers cache them. Without a
+build the sprite is embedded in the page as a data URI.
+"""
+import base64
+import html
+import os
+from functools import lru_cache
+from io import BytesIO
+from urllib.parse import quote
+
+from thumbnails import THUMBNAIL_SIZES, encode_image, load_thumbnail
+
+
+STATIC_DIR = 'static'
+SPRITE_DIR = os.path.join(STATIC_DIR, 'album')
+SPRITE_URL = 'app/static/album'
+ALBUM_COLUMNS = 5
+
+
+def sprite_name(group):
+    return f"{group.lower()}.webp"
+
+
+@lru_cache(maxsize=None)
+def build_sprite(full_names, size='card'):
+    """Encoded sprite with the thumbnails of full_names side by side."""
+    from PIL import Image
+
+    (width, height), _ = THUMBNAIL_SIZES[size]
+    sprite = Image.new('RGB', (width * len(full_names), height), 'white')
+    for i, name in enumerate(full_names):
+        with Image.open(BytesIO(load_thumbnail(name, size))) as img:
+            sprite.paste(img.convert('RGB'), (i * width, 0))
+    return encode_image(sprite, 'webp')
+
+
+def write_sprites(groups, sprite_dir=SPRITE_DIR):
+    """Write one sprite per group; groups maps a group name to its players."""
+    os.makedirs(sprite_dir, exist_ok=True)
+    for group, group_players in groups.items():
+        names = tuple(player['full_name'] for player in group_players)
+        with open(os.path.join(sprite_dir, sprite_name(group)), 'wb') as f:
+            f.write(build_sprite(names))
+
+
+def sprite_src(group, group_players, sprite_dir=SPRITE_DIR):
+    if os.path.exists(os.path.join(sprite_dir, sprite_name(group))):
+        return f"{SPRITE_URL}/{sprite_name(group)}"
+    names = tuple(player['full_name'] for player in group_players)
+    return 'data:image/webp;base64,' + base64.b64encode(build_sprite(names)).decode('ascii')
+
+
+def album_grid_html(group, group_players, player_keys, columns=ALBUM_COLUMNS):
+    """HTML grid for one group; each card links to ?player=<key>.
+
+    player_keys gives, for each player, the key the app maps back to its
+    entry in the players list.
+    """
+    src = sprite_src(group, group_players)
+    n = len(group_players)
+    cards = []
+    for i, (player, key) in enumerate(zip(group_players, player_keys)):
+        # background-size/position em %, para o sprite escalar com a coluna
+        position = 0 if n == 1 else i * 100 / (n - 1)
+        cards.append(
+            f"<a class='album-card' href='?player={quote(str(key))}' target='_self'>"
+            f"<span class='album-name'>{html.escape(player['display_name'])}</span>"
+            f"<span class='album-photo' style='background-image:url(\"{src}\");"
+            f"background-size:{n * 100}% 100%;background-position:{position:.4f}% 0'></span>"
+            f"</a>"
+        )
+    return (
+        f"<div class='album-grid' style='grid-template-columns:repeat({columns}, 1fr)'>"
+        + ''.join(cards)
+        + "</div>"
+    )
+
+
+ALBUM_CSS = """
+<style>
+.album-grid {display: grid; gap: 1rem; margin-bottom: 1.5rem;}
+.album-card {display: block; text-decoration: none; color: inherit;}
+.album-name {display: inline-block; margin-bottom: 0.5rem; padding: 0.25rem 0.75rem;
+             border: 1px solid rgba(49, 51, 63, 0.2); border-radius: 0.5rem; font-size: 16px;}
+.album-card:hover .album-name {border-color: #ff4b4b; color: #ff4b4b;}
+.album-photo {display: block; width: 100%; aspect-ratio: 3 / 5;}
+</style>
+"""
+
+
+if __name__ == '__main__':
+    from profile_config import POSITION_GROUPS, players_by_position
+
+    write_sprites({group: players_by_position(position) for group, position in POSITION_GROUPS})
+    print(f"Wrote {len(POSITION_GROUPS)} sprites to {SPRITE_DIR}")
@@ -1,37 +1,62 @@
 import streamlit as st
-from utils import (
-    set_light_mode,
-    calculate_xA,
-    calculate_xT,
-    crop_figure,
-    load_and_resize_image,
-    get_competitions,
-    get_events_competition,
-    get_player_events_competition,
-    plot_passes,
-    plot_carries,
-    plot_reception_actions,
-    plot_shots
-)
-from statsbombpy import sb
-from enum import Enum
+from thumbnails import load_thumbnail
+from album import ALBUM_CSS, album_grid_html
+from warmup import WARMUP_ENABLED, BackgroundWarmUp
+from profile_config import (PLOT_FUNCTIONS, POSITION_GROUPS, PROFILE_PLOTS, SEASONS, events_version, players,
+                            players_by_position)
+from telemetry import (METRICS_FILE, METRICS_PORT, record_cache_lookup, record_cache_miss, registry,
+                       serve_metrics, span, start_trace, traced_cache)
+import os
 import warnings
 
 
 warnings.filterwarnings("ignore", message="The use_column_width parameter has been deprecated")
 
+# Seconds before a season's match list is fetched again to pick up new matches (unset: never)
+MATCH_LIST_TTL = int(os.environ['BRASIL70_MATCH_LIST_TTL']) if os.environ.get('BRASIL70_MATCH_LIST_TTL') else None
+
+# Season tables (events, index, summaries) kept per process: one per configured season,
+# so the table of an outdated match list is dropped once a new match is picked up
+SEASON_CACHE_ENTRIES = len(SEASONS)
+# Per-match summaries (a World Cup has up to 64 matches) and recent comparisons
+MATCH_SUMMARY_CACHE_ENTRIES = 64 * len(SEASONS)
+COMPARISON_CACHE_ENTRIES = 32
+
 
 # Initialize session state variables
 if "selected_player_data" not in st.session_state:
     st.session_state.selected_player_data = None
+if "comparison_players" not in st.session_state:
+    st.session_state.comparison_players = None
 
 def main():
     """Main function to run the Streamlit app."""
+    trace = start_trace()
     setup_page()
-    if st.session_state.selected_player_data is None:
+    select_player_from_query()
+    if st.session_state.comparison_players:
+        display_comparison()
+    elif st.session_state.selected_player_data is None:
         display_home_page()
     else:
         display_player_profile()
+    finish_rerun(trace)
+
+def finish_rerun(trace):
+    """Export the metrics and, when enabled, show the debug panel for this rerun."""
+    if METRICS_FILE:
+        registry.dump(METRICS_FILE)
+    if DEBUG_PANEL or st.query_params.get('debug') == '1':
+        display_debug_panel(trace)
+
+def display_debug_panel(trace):
+    """Per-stage timings and cache hit rates of the current rerun."""
+    with st.expander(f"Debug: rerun {trace.id}"):
+        rows = [f"| {stage} | {count} | {seconds * 1000:.1f} |" for stage, count, seconds in trace.stage_totals()]
+        st.markdown("| Stage | Calls | ms |\n|---|---|---|\n" + "\n".join(rows))
+        rows = [f"| {cache} | {hits}/{lookups} | {hits / lookups:.0%} |"
+                for cache, (hits, lookups) in sorted(trace.cache_rates().items()) if lookups]
+        st.markdown("| Cache | Hits | Hit rate |\n|---|---|---|\n" + "\n".join(rows))
 
 def setup_page():
     """Set up the Streamlit page configuration and styles."""
@@ -62,10 +87,26 @@ def display_home_page():
     st.header("Pick a player:")
 
     # Display players by position
-    display_players_by_position('Goalkeepers', players_by_position('Goalkeeper'))
-    display_players_by_position('Defenders', players_by_position('Defender'))
-    display_players_by_position('Midfielders', players_by_position('Midfielder'))
-    display_players_by_position('Forwards', players_by_position('Forward'))
+    if ALBUM_MODE == 'sprite':
+        st.markdown(ALBUM_CSS, unsafe_allow_html=True)
+    with span('home_images', mode=ALBUM_MODE):
+        for group, position in POSITION_GROUPS:
+            with span('home_group', group=group):
+                if ALBUM_MODE == 'sprite':
+                    display_album_group(group, position)
+                else:
+                    display_players_by_position(group, players_by_position(position))
+
+    display_comparison_picker()
+
+def display_comparison_picker():
+    """Pick several players to compare side by side."""
+    st.header("Compare players:")
+    selection = st.multiselect("Players", players, format_func=lambda player: player['display_name'],
+                               max_selections=MAX_COMPARED_PLAYERS, label_visibility='collapsed')
+    if st.button("Compare", disabled=len(selection) < 2):
+        st.session_state.comparison_players = selection
+        st.rerun()
 
 def display_players_by_position(position_name, players_list):
     """Display players of a specific position."""
@@ -78,9 +119,34 @@ def display_players_by_position(position_name, players_list):
             player_image = get_player_image(player['full_name'])
             st.image(player_image, use_container_width=True)
 
-def players_by_position(position):
-    """Get players filtered by position."""
-    return [player for player in players if player['position'] == position]
+def display_album_group(position_name, position):
+    """Display a position group as one sprite-backed HTML grid."""
+    st.markdown(f"<p style='font-size: 24px;'>{position_name}</p>", unsafe_allow_html=True)
+    st.markdown(get_album_group_html(position_name, position), unsafe_allow_html=True)
+
+def select_player_from_query():
+    """Open the profile linked from the sprite album (?player=<index in players>).
+
+    ?compare=<index>,<index>,... opens the comparison of those players.
+    """
+    compare_keys = st.query_params.get('compare')
+    if compare_keys and not st.session_state.comparison_players:
+        # Sem repetir jogadores, na ordem do link
+        keys = [key for key in dict.fromkeys(compare_keys.split(',')) if key.isdigit() and int(key) < len(players)]
+        if len(keys) >= 2:
+            st.session_state.comparison_players = [players[int(key)] for key in keys[:MAX_COMPARED_PLAYERS]]
+
+    player_key = st.query_params.get('player')
+    if player_key is None or st.session_state.selected_player_data is not None:
+        return
+    if player_key.isdigit() and int(player_key) < len(players):
+        st.session_state.selected_player_data = players[int(player_key)]
+
+def select_season():
+    """(competition name, season name) to profile; a picker appears when several are configured."""
+    if len(SEASONS) == 1:
+        return SEASONS[0]
+    return st.selectbox("Competition", SEASONS, format_func=lambda season: f"{season[1]} {season[0]}")
 
 def display_player_profile():
     """Display the selected player's profile with statistics and visualizations."""
@@ -91,39 +157,32 @@ def display_player_profile():
 
     if st.button("Back to main page"):
         st.session_state.selected_player_data = None
+        st.query_params.clear()
         return
 
+    if data_warmup is not None and data_warmup.running():
+        with st.spinner('Warming up player data...'), span('warmup_wait'):
+            data_warmup.wait()
+
+    competition_name, season_name = select_season()
+
     with st.spinner('Loading player data...'):
-        competitions = get_competitions_cached()
-        world_cup_competitions = competitions[competitions['competition_name'] == 'FIFA World Cup']
-        season_df = world_cup_competitions[world_cup_competitions['season_name'] == '1970']
-        if not season_df.empty:
-            season_data = season_df.iloc[0]
-            competition_id = season_data['competition_id']
-            season_id = season_data['season_id']
+        if DATA_MODE == 'artifacts':
+            profile = load_profile_artifact(player_name, competition_name, season_name)
         else:
-            st.error("1970 World Cup data not found.")
-            return
-
-        events = get_events_competition_cached(competition_id, season_id)
-        player_events = get_player_events_competition(events, player_name)
-
-        if player_events.empty:
-            st.warning(f"No event data available for {player_name} in the 1970 World Cup.")
-            return
-
-    # Calculate statistics
-    matches = player_events['match_id'].unique()
-    n_matches = len(matches)
-    passes = player_events[player_events['type'] == 'Pass']
-    assists = passes[passes['pass_goal_assist'] == True]
-    total_assists = len(assists)
-    shots = player_events[player_events['type'] == 'Shot']
-    goals = shots[shots['shot_outcome'] == 'Goal']
-    total_goals = len(goals)
-    total_xg = shots['shot_statsbomb_xg'].sum().round(2)
-    total_xt_pass, total_xt_carries = calculate_xT(player_events)
-    total_xa = calculate_xA(events, player_name).round(2)
+            profile = load_profile_events(player_name, competition_name, season_name)
+    if profile is None:
+        return
+    stats, plot_inputs, data_version = profile
+
+    # Statistics precomputed for every player
+    n_matches = stats['matches']
+    total_assists = stats['assists']
+    total_goals = stats['goals']
+    total_xg = round(stats['xg'], 2)
+    total_xa = round(stats['xa'], 2)
+    total_xt_pass = round(stats['xt_pass'], 2)
+    total_xt_carries = round(stats['xt_carry'], 2)
 
     st.header(f'{display_name}')
 
@@ -132,7 +191,8 @@ def display_player_profile():
         cols = st.columns(6)
 
         with cols[0]:
-            player_image = get_player_image(player_name)
+            with span('player_image', player=player_name):
+                player_image = get_player_image(player_name, 'profile')
             st.image(player_image)
 
         with cols[1]:
@@ -141,79 +201,341 @@ def display_player_profile():
                 st.metric(label="Age", value=player_age)
                 st.metric(label="xG", value=total_xg)
                 st.metric(label="xA", value=total_xa)
-                st.metric(label="Pass xT", value=total_xt_pass.round(2))
+                st.metric(label="Pass xT", value=total_xt_pass)
             with subcols[1]:
                 st.metric(label="Matches", value=n_matches)
                 st.metric(label="Goals", value=total_goals)
                 st.metric(label="Assists", value=total_assists)
-                st.metric(label="Carry xT", value=total_xt_carries.round(2))
+                st.metric(label="Carry xT", value=total_xt_carries)
+
+        # Plots are rendered once per player and dataset, then served from the figure cache
+        for col, (subheader, plot_name) in zip(cols[2:], PROFILE_PLOTS):
+            with col:
+                st.subheader(subheader)
+                with span('plot', plot=plot_name, player=player_name):
+                    plot_image = get_plot_image(player_name, plot_name, plot_inputs[plot_name], data_version)
+                st.image(plot_image, use_container_width=True)
+
+def load_season(competition_name, season_name):
+    """(competition_id, season_id, match ids) of a season, or None after showing an error."""
+    with span('season_lookup'):
+        season = get_season_ids(competition_name, season_name)
+    if season is None:
+        st.error(f"{season_name} {competition_name} data not found.")
+        return None
+    competition_id, season_id = season
+
+    with span('match_list', competition_id=competition_id, season_id=season_id):
+        match_ids = get_match_ids_cached(competition_id, season_id)
+    return competition_id, season_id, match_ids
+
+def load_profile_events(player_name, competition_name, season_name):
+    """(stats, plot inputs by plot, data version) computed from the season's events, or None."""
+    season = load_season(competition_name, season_name)
+    if season is None:
+        return None
+    competition_id, season_id, match_ids = season
+
+    with span('load_events', competition_id=competition_id, season_id=season_id):
+        event_index = get_event_index_cached(competition_id, season_id, match_ids)
+        player_summary = get_player_summary_cached(competition_id, season_id, match_ids)
+    stats = player_summary.get(player_name)
+
+    if stats is None:
+        st.warning(f"No event data available for {player_name} in the {season_name} {competition_name}.")
+        return None
+
+    data_version = events_version(competition_id, season_id, match_ids)
+    match_id = select_match(competition_id, season_id, player_name, event_index.matches(player_name))
+
+    if match_id is None:
+        with span('player_filter', player=player_name):
+            player_events = event_index.player(player_name)
+    else:
+        with span('match_filter', player=player_name, match_id=match_id):
+            stats = get_match_summary_cached(competition_id, season_id, match_ids, match_id)[player_name]
+            player_events = event_index.player_in_match(match_id, player_name)
+        data_version = f"{data_version}-{match_id}"
+
+    # Cada gráfico do modo ao vivo recebe os eventos do jogador
+    plot_inputs = {plot_name: player_events for plot_name in PLOT_FUNCTIONS}
+    return stats, plot_inputs, data_version
+
+def select_match(competition_id, season_id, player_name, player_match_ids):
+    """Match to profile, or None for the whole season; only the player's matches are offered."""
+    labels = get_match_labels_cached(competition_id, season_id)
+    order = {match_id: i for i, match_id in enumerate(labels)}
+    options = [None] + sorted(player_match_ids, key=lambda match_id: order.get(match_id, len(order)))
+    # Uma chave por jogador: a partida escolhida não passa para o próximo perfil
+    return st.selectbox("Match", options, key=f'profile_match-{player_name}',
+                        format_func=lambda match_id: "All matches" if match_id is None
+                        else labels.get(match_id, f"Match {match_id}"))
+
+def load_profile_artifact(player_name, competition_name, season_name):
+    """(stats, plot coordinates by plot, data version) from the player's pre-built artifact, or None."""
+    with span('load_artifact', player=player_name):
+        artifact = get_player_artifact_cached(competition_name, season_name, player_name)
+    if artifact is None:
+        st.warning(f"No event data available for {player_name} in the {season_name} {competition_name}.")
+        return None
+    return artifact['metrics'], artifact['plots'], artifact['events_version']
+
+def display_comparison():
+    """Display several players side by side, with each plot as small multiples."""
+    compared = st.session_state.comparison_players
+
+    if st.button("Back to main page"):
+        st.session_state.comparison_players = None
+        st.query_params.clear()
+        return
+
+    if data_warmup is not None and data_warmup.running():
+        with st.spinner('Warming up player data...'), span('warmup_wait'):
+            data_warmup.wait()
+
+    competition_name, season_name = select_season()
+    player_names = tuple(player['full_name'] for player in compared)
+
+    with st.spinner('Loading player data...'):
+        if DATA_MODE == 'artifacts':
+            comparison = load_comparison_artifacts(player_names, competition_name, season_name)
+        else:
+            comparison = load_comparison_events(player_names, competition_name, season_name)
+    if comparison is None:
+        return
+    stats_by_player, plots_by_player, data_version = comparison
+
+    missing = [player['display_name'] for player in compared if player['full_name'] not in stats_by_player]
+    if missing:
+        st.warning(f"No event data available for {', '.join(missing)} in the {season_name} {competition_name}.")
+    compared = [player for player in compared if player['full_name'] in stats_by_player]
+    if not compared:
+        return
+
+    st.header(' vs '.join(player['display_name'] for player in compared))
+
+    for col, player in zip(st.columns(len(compared)), compared):
+        stats = stats_by_player[player['full_name']]
+        with col:
+            st.subheader(player['display_name'])
+            subcols = st.columns([1, 1, 1])
+            with subcols[0]:
+                st.image(get_player_image(player['full_name']))
+            with subcols[1]:
+                st.metric(label="Age", value=player['age'])
+                st.metric(label="xG", value=round(stats['xg'], 2))
+                st.metric(label="xA", value=round(stats['xa'], 2))
+                st.metric(label="Pass xT", value=round(stats['xt_pass'], 2))
+            with subcols[2]:
+                st.metric(label="Matches", value=stats['matches'])
+                st.metric(label="Goals", value=stats['goals'])
+                st.metric(label="Assists", value=stats['assists'])
+                st.metric(label="Carry xT", value=round(stats['xt_carry'], 2))
 
-        # Plotting functions
-        with cols[2]:
-            st.subheader('Ball Receipts')
-            fig_rec_actions = plot_reception_actions(player_events)
-            st.pyplot(fig_rec_actions)
+    titles = {player['full_name']: player['display_name'] for player in compared}
+    for subheader, plot_name in PROFILE_PLOTS:
+        st.subheader(subheader)
+        data_by_title = {titles[name]: plots_by_player[name][plot_name] for name in titles}
+        with span('comparison_plot', plot=plot_name, players=len(titles)):
+            plot_image = get_comparison_plot_image(tuple(titles), plot_name, data_by_title, data_version)
+        st.image(plot_image, use_container_width=True)
 
-        with cols[3]:
-            st.subheader('Carries')
-            fig_carries = plot_carries(player_events)
-            st.pyplot(fig_carries)
+def load_comparison_events(player_names, competition_name, season_name):
+    """(stats by player, plot coordinates by player, data version) from the season's events, or None."""
+    season = load_season(competition_name, season_name)
+    if season is None:
+        return None
+    competition_id, season_id, match_ids = season
 
-        with cols[4]:
-            st.subheader('Passes')
-            fig_passes = plot_passes(player_events)
-            st.pyplot(fig_passes)
+    with span('load_comparison', players=len(player_names)):
+        stats_by_player, plots_by_player = get_comparison_cached(competition_id, season_id, match_ids, player_names)
+    return stats_by_player, plots_by_player, events_version(competition_id, season_id, match_ids)
 
-        with cols[5]:
-            st.subheader('Shots')
-            fig_shots = plot_shots(player_events)
-            st.pyplot(fig_shots)
+def load_comparison_artifacts(player_names, competition_name, season_name):
+    """(stats by player, plot coordinates by player, data version) from the players' artifacts."""
+    with span('load_artifact', players=len(player_names)):
+        artifacts = [get_player_artifact_cached(competition_name, season_name, name) for name in player_names]
+    artifacts = [artifact for artifact in artifacts if artifact is not None]
+    stats_by_player = {artifact['player']: artifact['metrics'] for artifact in artifacts}
+    plots_by_player = {artifact['player']: artifact['plots'] for artifact in artifacts}
+    data_version = '+'.join(sorted({artifact['events_version'] for artifact in artifacts}))
+    return stats_by_player, plots_by_player, data_version
+
+def get_comparison_plot_image(player_names, plot_name, data_by_title, data_version):
+    """Return the rendered PNG of one plot for several players, drawing it only on a cache miss."""
+    from figures import plot_cache, render_figure
+
+    def render():
+        import pitch_plots
+        _, draw_function_name, pitch_style = PLOT_FUNCTIONS[plot_name]
+        record_cache_miss('plots')
+        fig = pitch_plots.draw_small_multiples(getattr(pitch_plots, draw_function_name), data_by_title,
+                                               getattr(pitch_plots, pitch_style))
+        return render_figure(fig)
+
+    record_cache_lookup('plots')
+    return plot_cache.get_or_render(('compare', player_names, plot_name, data_version), render)
+
+def get_plot_image(player_name, plot_name, plot_input, data_version):
+    """Return the rendered PNG of one profile plot, drawing it only on a cache miss.
+
+    plot_input is the player's events, or the plot's coordinates in artifact mode.
+    """
+    from figures import figure_manager, plot_cache
+
+    def render():
+        # The plotting stack is only imported when a plot has to be drawn
+        import pitch_plots
+        plot_function_name, draw_function_name, pitch_style = PLOT_FUNCTIONS[plot_name]
+        if DATA_MODE == 'artifacts':
+            plot_function = getattr(pitch_plots, draw_function_name)
+        else:
+            import utils
+            plot_function = getattr(utils, plot_function_name)
+        record_cache_miss('plots')
+        return figure_manager.render(plot_function, plot_input, getattr(pitch_plots, pitch_style))
+
+    record_cache_lookup('plots')
+    return plot_cache.get_or_render((player_name, plot_name, data_version), render)
 
 # Caching functions to improve performance
-@st.cache_data
+@traced_cache('competitions', st.cache_data)
 def get_competitions_cached():
     """Cache the competitions data."""
+    from utils import get_competitions
     return get_competitions()
 
-@st.cache_data
-def get_events_competition_cached(competition_id, season_id):
-    """Cache the events data for a competition and season."""
-    return get_events_competition(competition_id, season_id)
+def get_season_ids(competition_name, season_name):
+    """Return (competition_id, season_id) for a competition and season, or None."""
+    competitions = get_competitions_cached()
+    season_df = competitions[(competitions['competition_name'] == competition_name) &
+                             (competitions['season_name'] == season_name)]
+    if season_df.empty:
+        return None
+    season_data = season_df.iloc[0]
+    return season_data['competition_id'], season_data['season_id']
+
+@st.cache_resource
+def get_match_cache():
+    """Scored events per match, shared by every season view in this server process."""
+    from utils import MatchEventsCache
+    return MatchEventsCache()
 
-@st.cache_data
-def get_player_image(name):
-    """Cache the player image loading and resizing."""
+@traced_cache('match_ids', st.cache_data(ttl=MATCH_LIST_TTL))
+def get_match_ids_cached(competition_id, season_id):
+    """Cache a season's match ids; once the TTL expires the source is asked for new matches."""
+    from utils import get_match_ids
+    return tuple(get_match_ids(competition_id, season_id, refresh=MATCH_LIST_TTL is not None))
+
+@traced_cache('events', st.cache_data(max_entries=SEASON_CACHE_ENTRIES))
+def get_events_competition_cached(competition_id, season_id, match_ids):
+    """Cache the compact events of a season, assembled from the per-match cache.
+
+    Keyed by the match ids, so a new match only loads and scores that match.
+    """
+    with span('assemble_events', matches=len(match_ids)):
+        return get_match_cache().events(competition_id, season_id, match_ids)
+
+@traced_cache('event_index', st.cache_resource(max_entries=SEASON_CACHE_ENTRIES))
+def get_event_index_cached(competition_id, season_id, match_ids):
+    """Build the match and player index once per events table and share it across sessions."""
+    from utils import build_event_index
+    events = get_events_competition_cached(competition_id, season_id, match_ids)
+    with span('event_index', rows=len(events)):
+        return build_event_index(events)
+
+@traced_cache('match_labels', st.cache_data(ttl=MATCH_LIST_TTL))
+def get_match_labels_cached(competition_id, season_id):
+    """Cache the 'Home 4-1 Away' label of each match of a season."""
+    from utils import get_season_matches, match_labels
+    return match_labels(get_season_matches(competition_id, season_id))
+
+@traced_cache('match_summary', st.cache_data(max_entries=MATCH_SUMMARY_CACHE_ENTRIES))
+def get_match_summary_cached(competition_id, season_id, match_ids, match_id):
+    """Cache the metrics of every player in one match, keyed by player."""
+    from utils import build_player_summary, calculate_xA_by_player
+    match_events = get_event_index_cached(competition_id, season_id, match_ids).match(match_id)
+    summary = build_player_summary(match_events, calculate_xA_by_player(match_events))
+    return summary.to_dict('index')
+
+@traced_cache('player_summary', st.cache_data(max_entries=SEASON_CACHE_ENTRIES))
+def get_player_summary_cached(competition_id, season_id, match_ids):
+    """Cache the metrics of every player in a competition and season, keyed by player."""
+    from utils import build_player_summary, calculate_xA_by_player
+    events = get_events_competition_cached(competition_id, season_id, match_ids)
+    with span('calculate_xA', rows=len(events)):
+        xA_by_player = calculate_xA_by_player(events)
+    with span('player_summary', rows=len(events)):
+        summary = build_player_summary(events, xA_by_player)
+    return summary.to_dict('index')
+
+@traced_cache('comparisons', st.cache_data(max_entries=COMPARISON_CACHE_ENTRIES))
+def get_comparison_cached(competition_id, season_id, match_ids, player_names):
+    """Cache the metrics and plot coordinates of a set of players, computed in one pass."""
+    from utils import compare_players
+    events = get_events_competition_cached(competition_id, season_id, match_ids)
+    event_index = get_event_index_cached(competition_id, season_id, match_ids)
+    summary, plots_by_player = compare_players(events, list(player_names), event_index)
+    return summary.to_dict('index'), plots_by_player
+
+@traced_cache('artifacts', st.cache_data)
+def get_player_artifact_cached(competition_name, season_name, player_name):
+    """Cache a player's pre-built profile artifact (metrics and plot coordinates)."""
+    from player_artifacts import load_artifact
+    return load_artifact(competition_name, season_name, player_name)
+
+@traced_cache('player_images', st.cache_data)
+def get_player_image(name, size='card'):
+    """Cache the player's pre-generated thumbnail bytes."""
     try:
-        return load_and_resize_image(name, final_size=(300, 500), aspect_ratio=3/5)
+        return load_thumbnail(name, size)
     except Exception:
         st.warning(f"Image for {name} could not be loaded.")
         return None  # Or return a default image
 
-# Player data
-players = [
-    {'display_name': 'Ado', 'full_name': 'Eduardo Roberto Stinghen', 'age': 23, 'position': 'Goalkeeper'},
-    {'display_name': 'Émerson Leão', 'full_name': 'Emerson Leão', 'age': 20, 'position': 'Goalkeeper'},
-    {'display_name': 'Félix', 'full_name': 'Félix Miéli Venerando', 'age': 32, 'position': 'Goalkeeper'},
-    {'display_name': 'Carlos Alberto', 'full_name': 'Carlos Alberto Torres', 'age': 25, 'position': 'Defender'},
-    {'display_name': 'Brito', 'full_name': 'Hercules Brito Ruas', 'age': 30, 'position': 'Defender'},
-    {'display_name': 'Piazza', 'full_name': 'Wilson da Silva Piazza', 'age': 26, 'position': 'Defender'},
-    {'display_name': 'Everaldo', 'full_name': 'Everaldo Marques da Silva', 'age': 25, 'position': 'Defender'},
-    {'display_name': 'Zé Maria', 'full_name': 'José Maria Rodrigues Alves', 'age': 21, 'position': 'Defender'},
-    {'display_name': 'Fontana', 'full_name': 'José de Anchieta Fontana', 'age': 29, 'position': 'Defender'},
-    {'display_name': 'Baldocchi', 'full_name': 'José Guilherme Baldocchi', 'age': 24, 'position': 'Defender'},
-    {'display_name': 'Joel Camargo', 'full_name': 'Joel Camargo', 'age': 23, 'position': 'Defender'},
-    {'display_name': 'Marco Antônio', 'full_name': 'Marco Antônio Feliciano', 'age': 19, 'position': 'Defender'},
-    {'display_name': 'Clodoaldo', 'full_name': 'Clodoaldo Tavares de Santana', 'age': 20, 'position': 'Midfielder'},
-    {'display_name': 'Gérson', 'full_name': 'Gérson de Oliveira Nunes', 'age': 29, 'position': 'Midfielder'},
-    {'display_name': 'Rivellino', 'full_name': 'Roberto Rivelino', 'age': 24, 'position': 'Midfielder'},
-    {'display_name': 'Pelé', 'full_name': 'Édson Arantes do Nascimento', 'age': 29, 'position': 'Midfielder'},
-    {'display_name': 'Paulo Cézar Caju', 'full_name': 'Paulo Cézar Lima', 'age': 20, 'position': 'Midfielder'},
-    {'display_name': 'Jairzinho', 'full_name': 'Jair Ventura Filho', 'age': 25, 'position': 'Forward'},
-    {'display_name': 'Tostão', 'full_name': 'Eduardo Gonçalves de Andrade', 'age': 23, 'position': 'Forward'},
-    {'display_name': 'Roberto Miranda', 'full_name': 'Roberto Lopes de Miranda', 'age': 25, 'position': 'Forward'},
-    {'display_name': 'Edu', 'full_name': 'Jonas Eduardo Américo', 'age': 20, 'position': 'Forward'},
-    {'display_name': 'Dadá Maravilha', 'full_name': 'Dario José dos Santos', 'age': 24, 'position': 'Forward'},
-]
+@traced_cache('album_html', st.cache_data)
+def get_album_group_html(position_name, position):
+    """Cache the album grid HTML of one position group."""
+    group_players = players_by_position(position)
+    return album_grid_html(position_name, group_players, [players.index(player) for player in group_players])
+
+def warm_up_data():
+    """Fill the shared caches for every configured season before the first profile is opened."""
+    for competition_name, season_name in SEASONS:
+        season = get_season_ids(competition_name, season_name)
+        if season is None:
+            continue
+        competition_id, season_id = season
+        match_ids = get_match_ids_cached(competition_id, season_id)
+        get_event_index_cached(competition_id, season_id, match_ids)
+        get_player_summary_cached(competition_id, season_id, match_ids)
+
+@st.cache_resource
+def start_data_warmup():
+    """Start the background warm-up once per server process."""
+    return BackgroundWarmUp(warm_up_data, name='brasil70-warmup').start()
+
+@st.cache_resource
+def start_metrics_server():
+    """Serve the Prometheus metrics once per server process."""
+    return serve_metrics(METRICS_PORT)
+
+# Home page layout: 'columns' (one st.image and st.button per player) or 'sprite'
+ALBUM_MODE = os.environ.get('BRASIL70_ALBUM_MODE', 'columns')
+
+# Largest number of players in one comparison
+MAX_COMPARED_PLAYERS = 6
+
+# Where profiles come from: 'live' (events loaded and scored in the app) or
+# 'artifacts' (per-player files written by player_artifacts.py)
+DATA_MODE = os.environ.get('BRASIL70_DATA_MODE', 'live')
+
+# Show the per-rerun debug panel on every page (it is also shown for ?debug=1)
+DEBUG_PANEL = os.environ.get('BRASIL70_DEBUG', '').lower() in ('1', 'true', 'yes')
+
+# Opt-in (BRASIL70_WARMUP=1): start loading data as soon as the server runs the app
+data_warmup = start_data_warmup() if WARMUP_ENABLED and DATA_MODE == 'live' else None
+metrics_server = start_metrics_server() if METRICS_PORT else None
 
 if __name__ == '__main__':
     main()
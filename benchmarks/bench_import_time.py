@@ -0,0 +1,62 @@
+# benchmarks/bench_import_time.py
+"""Cold-start import budget for the app.
+
+Runs ``python -X importtime -c "import app"`` in a fresh interpreter and
+fails when the cumulative import time goes over BRASIL70_IMPORT_BUDGET_MS, or
+when the home page path pulls in the data/plotting stack. Run with
+``pytest benchmarks/``, or ``python benchmarks/bench_import_time.py`` for a
+breakdown of the slowest modules.
+"""
+import os
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_BUDGET_MS = float(os.environ.get('BRASIL70_IMPORT_BUDGET_MS', 1000))
+IMPORT_RUNS = int(os.environ.get('BRASIL70_IMPORT_RUNS', 3))
+
+# Carregados só quando o perfil de um jogador é aberto
+LAZY_MODULES = ('pandas', 'numpy', 'scipy', 'matplotlib', 'mplsoccer', 'statsbombpy', 'PIL', 'requests')
+
+
+def measure_imports(module='app'):
+    """Import module in a fresh interpreter; returns {module: (self_us, cumulative_us)}."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+        cwd=REPO_DIR, capture_output=True, text=True, check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def cold_start_ms(module='app', runs=IMPORT_RUNS):
+    # Melhor de várias execuções, para não medir ruído do disco/CPU
+    return min(measure_imports(module)[module][1] for _ in range(runs)) / 1000
+
+
+def test_home_page_skips_heavy_imports():
+    imported = {name.split('.')[0] for name in measure_imports()}
+    assert not imported & set(LAZY_MODULES)
+
+
+def test_cold_start_within_budget():
+    elapsed = cold_start_ms()
+    assert elapsed <= IMPORT_BUDGET_MS, f"import app took {elapsed:.0f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)"
+
+
+if __name__ == '__main__':
+    timings = measure_imports()
+    total = timings['app'][1]
+    print(f"import app: {total / 1000:.1f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)")
+    top_level = {name: cumulative for name, (_, cumulative) in timings.items() if '.' not in name}
+    for name, cumulative in sorted(top_level.items(), key=lambda item: -item[1])[:15]:
+        print(f"{cumulative / 1000:8.1f} ms  {name}")
+    heavy = sorted(name for name in top_level if name in LAZY_MODULES)
+    if heavy:
+        print(f"heavy modules imported: {', '.join(heavy)}")
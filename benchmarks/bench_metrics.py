@@ -0,0 +1,77 @@
+# benchmarks/bench_metrics.py
+"""Metric and lookup benchmarks on synthetic event tables."""
+import pytest
+
+from synthetic_events import BENCH_PLAYER
+from utils import (
+    build_event_index, build_player_summary, calculate_xA, calculate_xA_by_player, calculate_xT,
+    compute_xT, get_player_events_competition, normalize_events,
+)
+from xt_model import fit_xt
+
+
+def test_normalize_events(benchmark, raw_events):
+    benchmark(normalize_events, raw_events)
+
+
+def test_compute_xT(benchmark, events):
+    benchmark(compute_xT, events)
+
+
+def test_calculate_xT_raw(benchmark, raw_events):
+    # Caminho original: filtra o jogador na tabela crua e calcula o xT dos seus eventos
+    player_events = raw_events[raw_events['player'] == BENCH_PLAYER]
+    benchmark(calculate_xT, player_events)
+
+
+def test_calculate_xT(benchmark, player_events):
+    benchmark(calculate_xT, player_events)
+
+
+def test_calculate_xA_raw(benchmark, raw_events):
+    benchmark(calculate_xA, raw_events, BENCH_PLAYER)
+
+
+def test_calculate_xA(benchmark, events):
+    benchmark(calculate_xA, events, BENCH_PLAYER)
+
+
+def test_calculate_xA_by_player(benchmark, events):
+    benchmark(calculate_xA_by_player, events)
+
+
+def test_build_player_summary(benchmark, events):
+    benchmark(build_player_summary, events)
+
+
+def test_get_player_events_competition_raw(benchmark, raw_events):
+    benchmark(get_player_events_competition, raw_events, BENCH_PLAYER)
+
+
+def test_get_player_events_competition(benchmark, events):
+    benchmark(get_player_events_competition, events, BENCH_PLAYER)
+
+
+def test_get_player_events_competition_indexed(benchmark, events):
+    index = build_event_index(events)
+    benchmark(get_player_events_competition, events, BENCH_PLAYER, index)
+
+
+def test_build_event_index(benchmark, events):
+    benchmark(build_event_index, events)
+
+
+def test_player_match_events_mask(benchmark, events):
+    match_id = events['match_id'].iloc[-1]
+    benchmark(lambda: events[(events['match_id'] == match_id) & (events['player'] == BENCH_PLAYER)])
+
+
+def test_player_match_events_indexed(benchmark, events):
+    index = build_event_index(events)
+    match_id = index.matches(BENCH_PLAYER)[-1]
+    benchmark(index.player_in_match, match_id, BENCH_PLAYER)
+
+
+@pytest.mark.parametrize('grid', [(12, 8), (24, 16), (48, 32)], ids=lambda grid: f"{grid[0]}x{grid[1]}")
+def test_fit_xt(benchmark, events, grid):
+    benchmark(fit_xt, events, *grid)
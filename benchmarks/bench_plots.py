@@ -0,0 +1,44 @@
+# benchmarks/bench_plots.py
+"""Plot and image benchmarks for one player's events."""
+import matplotlib.pyplot as plt
+import pytest
+
+import utils
+from figures import PitchFigureManager, render_figure
+
+PLOTS = {
+    'passes': (utils.plot_passes, utils.DEFAULT_PITCH),
+    'carries': (utils.plot_carries, utils.DEFAULT_PITCH),
+    'shots': (utils.plot_shots, utils.DEFAULT_PITCH),
+    'receipts': (utils.plot_reception_actions, utils.RECEPTION_PITCH),
+}
+
+
+@pytest.mark.parametrize('plot', sorted(PLOTS))
+def test_plot(benchmark, player_events, plot):
+    # Figura nova a cada chamada, como no app original
+    plot_function, _ = PLOTS[plot]
+    benchmark(lambda: render_figure(plot_function(player_events)))
+
+
+@pytest.mark.parametrize('plot', sorted(PLOTS))
+def test_plot_pooled(benchmark, player_events, plot):
+    plot_function, pitch_kwargs = PLOTS[plot]
+    manager = PitchFigureManager()
+    benchmark(manager.render, plot_function, player_events, pitch_kwargs)
+
+
+def test_plot_reception_actions_kde(benchmark, player_events):
+    benchmark.pedantic(lambda: render_figure(utils.plot_reception_actions(player_events, mode='kde')), rounds=3)
+
+
+def test_crop_figure(benchmark, player_events):
+    fig = utils.plot_passes(player_events)
+    try:
+        benchmark(utils.crop_figure, fig)
+    finally:
+        plt.close(fig)
+
+
+def test_load_and_resize_image(benchmark, repo_dir):
+    benchmark(utils.load_and_resize_image, 'Édson Arantes do Nascimento', (300, 500), 3/5)
@@ -0,0 +1,66 @@
+# benchmarks/conftest.py
+"""Shared fixtures for the benchmark suite.
+
+Every benchmark that takes ``bench_size`` runs once per selected table size
+(see synthetic_events.SIZES). Choose sizes with ``--bench-sizes`` or
+BRASIL70_BENCH_SIZES, e.g. ``pytest benchmarks --bench-sizes match,seasons``.
+"""
+import os
+
+import matplotlib
+import pytest
+
+matplotlib.use('Agg')
+
+from synthetic_events import BENCH_PLAYER, EVENTS_PER_MATCH, SIZES, make_competition_events  # noqa: E402
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--bench-sizes', default=os.environ.get('BRASIL70_BENCH_SIZES', 'match,tournament'),
+        help=f"comma-separated table sizes to benchmark ({', '.join(SIZES)})",
+    )
+    parser.addoption(
+        '--bench-events-per-match', type=int, default=EVENTS_PER_MATCH,
+        help="events generated per synthetic match",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if 'bench_size' in metafunc.fixturenames:
+        sizes = [size.strip() for size in metafunc.config.getoption('bench_sizes').split(',') if size.strip()]
+        unknown = set(sizes) - set(SIZES)
+        if unknown:
+            raise pytest.UsageError(f"unknown bench size(s): {', '.join(sorted(unknown))}")
+        metafunc.parametrize('bench_size', sizes, scope='session')
+
+
+@pytest.fixture(scope='session')
+def raw_events(request, bench_size):
+    """Flattened events as returned by get_events_competition."""
+    n_events = request.config.getoption('bench_events_per_match')
+    return make_competition_events(SIZES[bench_size], n_events)
+
+
+@pytest.fixture(scope='session')
+def events(raw_events):
+    """Normalized events with xT columns, as cached by the app."""
+    from utils import compute_xT, normalize_events
+
+    return compute_xT(normalize_events(raw_events))
+
+
+@pytest.fixture(scope='session')
+def player_events(events):
+    from utils import get_player_events_competition
+
+    return get_player_events_competition(events, BENCH_PLAYER)
+
+
+@pytest.fixture
+def repo_dir(monkeypatch):
+    # Os caminhos de imagem do utils são relativos à raiz do projeto
+    monkeypatch.chdir(REPO_DIR)
+    return REPO_DIR
@@ -0,0 +1,147 @@
+# benchmarks/synthetic_events.py
+"""Synthetic event tables with the flattened StatsBomb schema.
+
+make_match_events() returns a frame shaped like
+sb.events(match_id, flatten_attrs=True): one row per event, rows grouped by
+event type, list-valued location columns and NaN for attributes an event
+type does not have. make_competition_events() concatenates matches the way
+utils.get_events_competition does, so the benchmarks exercise the same
+columns and dtypes as the app.
+"""
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+
+# Número de partidas de cada tamanho de tabela
+SIZES = {
+    'match': 1,
+    'tournament': 32,     # Copa de 1970
+    'seasons': 5 * 64,    # cinco Copas de 64 jogos
+}
+EVENTS_PER_MATCH = 3500
+
+BRAZIL = [
+    'Félix Miéli Venerando', 'Carlos Alberto Torres', 'Hercules Brito Ruas',
+    'Wilson da Silva Piazza', 'Everaldo Marques da Silva', 'Clodoaldo Tavares de Santana',
+    'Gérson de Oliveira Nunes', 'Roberto Rivelino', 'Jair Ventura Filho',
+    'Eduardo Gonçalves de Andrade', 'Édson Arantes do Nascimento',
+]
+OPPONENTS = [f"Opponent Player {i}" for i in range(1, 12)]
+BENCH_PLAYER = 'Édson Arantes do Nascimento'
+
+# Tipos de evento e frequência aproximada numa partida real
+EVENT_TYPES = {
+    'Pass': 0.30,
+    'Ball Receipt*': 0.28,
+    'Carry': 0.24,
+    'Pressure': 0.08,
+    'Ball Recovery': 0.03,
+    'Duel': 0.02,
+    'Clearance': 0.02,
+    'Dribble': 0.01,
+    'Foul Committed': 0.01,
+    'Shot': 0.01,
+}
+
+
+def _points(rng, n, dims=2):
+    points = rng.uniform((0, 0, 0)[:dims], (120, 80, 2.67)[:dims], size=(n, dims)).round(1)
+    return pd.Series(points.tolist(), dtype=object)
+
+
+def _uuids(rng, n):
+    # Ids no formato UUID dos eventos do StatsBomb
+    digits = rng.bytes(16 * n).hex()
+    return [
+        f"{d[:8]}-{d[8:12]}-{d[12:16]}-{d[16:20]}-{d[20:]}"
+        for d in (digits[i:i + 32] for i in range(0, 32 * n, 32))
+    ]
+
+
+def _where(mask, values):
+    # Atributo só existe para um tipo de evento; o resto é NaN, como no sb.events
+    if np.isscalar(values):
+        values = np.full(len(mask), values, dtype=object)
+    return pd.Series(values, dtype=object).where(mask, np.nan)
+
+
+def make_match_events(match_id, n_events=EVENTS_PER_MATCH, seed=0):
+    rng = np.random.default_rng((seed, match_id))
+    n = n_events
+
+    types = rng.choice(list(EVENT_TYPES), size=n, p=list(EVENT_TYPES.values()))
+    is_pass = types == 'Pass'
+    is_carry = types == 'Carry'
+    is_shot = types == 'Shot'
+    is_receipt = types == 'Ball Receipt*'
+
+    home = rng.random(n) < 0.5
+    squad = rng.integers(0, 11, size=n)
+    players = np.where(home, np.array(BRAZIL, dtype=object)[squad], np.array(OPPONENTS, dtype=object)[squad])
+    ids = _uuids(rng, n)
+
+    seconds = np.sort(rng.uniform(0, 95 * 60, size=n))
+    period = np.where(seconds < 47 * 60, 1, 2)
+
+    # Passe-chave: o último passe antes de cada chute, em 70% dos chutes
+    last_pass = np.maximum.accumulate(np.where(is_pass, np.arange(n), -1))
+    prev_pass = np.concatenate(([-1], last_pass[:-1]))
+    has_key_pass = is_shot & (prev_pass >= 0) & (rng.random(n) < 0.7)
+    key_pass_ids = np.array(ids, dtype=object)[np.maximum(prev_pass, 0)]
+
+    pass_outcome = rng.choice(['Incomplete', 'Out', 'Pass Offside', None], size=n, p=[0.12, 0.04, 0.01, 0.83])
+    shot_outcome = rng.choice(['Goal', 'Saved', 'Off T', 'Blocked'], size=n, p=[0.12, 0.3, 0.35, 0.23])
+    xg = rng.beta(0.8, 7, size=n)
+
+    events = pd.DataFrame({
+        'id': ids,
+        'index': np.arange(1, n + 1),
+        'period': period,
+        'timestamp': pd.to_datetime(seconds, unit='s').strftime('%H:%M:%S.%f').str[:-3],
+        'minute': (seconds // 60).astype(int),
+        'second': (seconds % 60).astype(int),
+        'type': types,
+        'possession': np.cumsum(rng.random(n) < 0.05) + 1,
+        'possession_team': np.where(home, 'Brazil', 'Opponent'),
+        'play_pattern': rng.choice(['Regular Play', 'From Throw In', 'From Free Kick', 'From Corner'], size=n),
+        'team': np.where(home, 'Brazil', 'Opponent'),
+        'player': players,
+        'position': rng.choice(['Goalkeeper', 'Center Back', 'Center Midfield', 'Center Forward'], size=n),
+        'location': _points(rng, n),
+        'duration': rng.exponential(1.2, size=n),
+        'under_pressure': _where(rng.random(n) < 0.15, True),
+        'related_events': [[ids[i - 1]] if i else np.nan for i in range(n)],
+        'match_id': match_id,
+        'pass_recipient': _where(is_pass, np.array(BRAZIL + OPPONENTS, dtype=object)[rng.integers(0, 22, size=n)]),
+        'pass_length': np.where(is_pass, rng.uniform(1, 60, size=n), np.nan),
+        'pass_angle': np.where(is_pass, rng.uniform(-np.pi, np.pi, size=n), np.nan),
+        'pass_height': _where(is_pass, rng.choice(['Ground Pass', 'Low Pass', 'High Pass'], size=n)),
+        'pass_end_location': _where(is_pass, _points(rng, n)),
+        'pass_outcome': _where(is_pass & (pass_outcome != None), pass_outcome),
+        'pass_goal_assist': _where(is_pass & (rng.random(n) < 0.005), True),
+        'pass_shot_assist': _where(is_pass & (rng.random(n) < 0.02), True),
+        'carry_end_location': _where(is_carry, _points(rng, n)),
+        'ball_receipt_outcome': _where(is_receipt & (rng.random(n) < 0.05), 'Incomplete'),
+        'shot_statsbomb_xg': np.where(is_shot, xg, np.nan),
+        'shot_end_location': _where(is_shot, _points(rng, n, dims=3)),
+        'shot_outcome': _where(is_shot, shot_outcome),
+        'shot_type': _where(is_shot, 'Open Play'),
+        'shot_key_pass_id': _where(has_key_pass, key_pass_ids),
+        'tactics': [{'formation': 442, 'lineup': []} if i < 2 else np.nan for i in range(n)],
+    })
+
+    # sb.events agrupa as linhas por tipo de evento e ordena as colunas
+    order = np.argsort(pd.factorize(events['type'])[0], kind='stable')
+    return events.iloc[order].reset_index(drop=True).sort_index(axis=1)
+
+
+@lru_cache(maxsize=None)
+def make_competition_events(n_matches, n_events=EVENTS_PER_MATCH, seed=0):
+    """Events of n_matches matches, concatenated like get_events_competition.
+
+    Cached: callers must not modify the returned frame.
+    """
+    matches = [make_match_events(3_800_000 + i, n_events, seed) for i in range(n_matches)]
+    return pd.concat(matches).reset_index()
@@ -0,0 +1,123 @@
+# data_sources.py
+"""Where competitions, matches and events come from.
+
+StatsBombAPISource wraps statsbombpy (remote open data or the paid API).
+LocalOpenDataSource reads a local checkout of
+https://github.com/statsbomb/open-data, one match file at a time, and builds
+the same flattened frames without any network access.
+"""
+import os
+
+import pandas as pd
+
+try:
+    import orjson
+
+    def _parse_json(data):
+        return orjson.loads(data)
+except ImportError:
+    import json
+
+    def _parse_json(data):
+        return json.loads(data)
+
+
+OPEN_DATA_DIR = os.environ.get('BRASIL70_OPEN_DATA', '')
+
+
+class StatsBombAPISource:
+
+    # statsbombpy só é importado quando a rede é de fato usada
+    def competitions(self):
+        from statsbombpy import sb
+        return sb.competitions()
+
+    def matches(self, competition_id, season_id):
+        from statsbombpy import sb
+        return sb.matches(competition_id=competition_id, season_id=season_id)
+
+    def events(self, match_id):
+        from statsbombpy import sb
+        return sb.events(match_id=match_id, flatten_attrs=True)
+
+
+class LocalOpenDataSource:
+    """Read the open-data JSON tree rooted at root (the repo or its data/ folder)."""
+
+    def __init__(self, root):
+        data_dir = os.path.join(root, 'data')
+        self.root = data_dir if os.path.isdir(data_dir) else root
+
+    def _load(self, *parts):
+        with open(os.path.join(self.root, *parts), 'rb') as f:
+            return _parse_json(f.read())
+
+    def competitions(self):
+        return pd.DataFrame(self._load('competitions.json'))
+
+    def matches(self, competition_id, season_id):
+        matches = self._load('matches', str(competition_id), f"{season_id}.json")
+        for match in matches:
+            metadata = match.pop('metadata', {})
+            for team in ('home_team', 'away_team'):
+                side = team.split('_')[0]
+                managers = match[team].pop('managers', [])
+                match[f"{side}_managers"] = ', '.join(m['name'] for m in managers)
+                match.update(_manager_columns(managers, f"{side}_manager"))
+            for key in ('data_version', 'shot_fidelity_version', 'xy_fidelity_version'):
+                match[key] = metadata.get(key)
+
+        # Mesmos nomes de coluna do sb.matches (home_team_home_team_name -> home_team, ...)
+        matches = pd.json_normalize(matches, sep='_')
+        columns = {}
+        for col in matches.columns:
+            for prefix in ('competition', 'season', 'home_team', 'away_team'):
+                if col.startswith(f"{prefix}_{prefix}_"):
+                    columns[col] = col.replace(f"{prefix}_{prefix}_", f"{prefix}_", 1)
+        matches = matches.rename(columns=columns)
+        matches['competition'] = matches['competition_country_name'] + ' - ' + matches['competition_name']
+        return matches.rename(columns={
+            'season_name': 'season',
+            'home_team_name': 'home_team',
+            'away_team_name': 'away_team',
+            'competition_stage_name': 'competition_stage',
+            'stadium_name': 'stadium',
+            'referee_name': 'referee',
+        })
+
+    def events(self, match_id):
+        # Mesmo achatamento do sb.events(flatten_attrs=True), com os helpers do statsbombpy
+        from statsbombpy import entities
+        from statsbombpy.helpers import filter_and_group_events
+
+        events = entities.events(self._load('events', f"{match_id}.json"), match_id)
+        events = filter_and_group_events(events, {}, 'dataframe', True)
+        frames = [pd.DataFrame(evs) for evs in events.values()]
+        return pd.concat(frames, axis=0, ignore_index=True, sort=True)
+
+    def iter_events(self, match_ids):
+        """Yield (match_id, events) one match at a time."""
+        for match_id in match_ids:
+            yield match_id, self.events(match_id)
+
+
+def _manager_columns(managers, prefix):
+    # Como o sb.matches: vários técnicos viram valores separados por vírgula
+    if not managers:
+        return {}
+    managers = pd.json_normalize(managers, sep='_')
+    if len(managers) == 1:
+        return {f"{prefix}_{col}": value for col, value in managers.iloc[0].items()}
+    return {
+        f"{prefix}_{col}": ', '.join(managers[col].dropna().astype(str))
+        for col in managers.columns
+    }
+
+
+def get_data_source(open_data_dir=OPEN_DATA_DIR):
+    if open_data_dir:
+        return LocalOpenDataSource(open_data_dir)
+    return StatsBombAPISource()
+
+
+default_source = get_data_source()
@@ -0,0 +1,155 @@
+# event_store.py
+import json
+import logging
+import os
+import pickle
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+EVENT_STORE_DIR = os.environ.get('BRASIL70_EVENT_STORE', os.path.join('data', 'event_store'))
+
+# Chave dos metadados do Parquet com as colunas object e as gravadas como JSON
+STORE_METADATA_KEY = b'brasil70'
+
+
+class EventStore:
+    """Disk-backed store of flattened StatsBomb frames.
+
+    Files are laid out as ``<root>/<competition_id>/<season_id>/<match_id>.parquet``
+    with the season's match list in ``matches.parquet`` next to them. Frames
+    read back like they were written: object columns stay object with NaN
+    for missing values, and nested values (tactics, related_events, ...) are
+    stored as JSON so dicts, lists and ints inside them survive unchanged.
+    """
+
+    def __init__(self, root=EVENT_STORE_DIR):
+        self.root = root
+
+    def _season_dir(self, competition_id, season_id):
+        return os.path.join(self.root, str(competition_id), str(season_id))
+
+    def _path(self, competition_id, season_id, name, ext='parquet'):
+        return os.path.join(self._season_dir(competition_id, season_id), f"{name}.{ext}")
+
+    def read_matches(self, competition_id, season_id):
+        return self._read(competition_id, season_id, 'matches')
+
+    def write_matches(self, competition_id, season_id, matches):
+        self._write(competition_id, season_id, 'matches', matches)
+
+    def read_events(self, competition_id, season_id, match_id):
+        return self._read(competition_id, season_id, str(match_id))
+
+    def write_events(self, competition_id, season_id, match_id, events):
+        self._write(competition_id, season_id, str(match_id), events)
+
+    def _read(self, competition_id, season_id, name):
+        path = self._path(competition_id, season_id, name)
+        if os.path.exists(path):
+            return _read_parquet(path)
+
+        # Frames que o Arrow não conseguiu serializar ficam em pickle
+        path = self._path(competition_id, season_id, name, ext='pkl')
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+
+        return None
+
+    def _write(self, competition_id, season_id, name, df):
+        os.makedirs(self._season_dir(competition_id, season_id), exist_ok=True)
+        try:
+            self._atomic_write(self._path(competition_id, season_id, name),
+                               lambda f: _write_parquet(df, f))
+        except (ValueError, TypeError, NotImplementedError) as error:
+            # Só erros de serialização do Arrow; sem engine de Parquet o erro sobe
+            logger.warning("Writing %s/%s/%s as pickle: %s", competition_id, season_id, name, error)
+            self._atomic_write(self._path(competition_id, season_id, name, ext='pkl'),
+                               lambda f: pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _atomic_write(self, path, write):
+        # Escreve num arquivo temporário e renomeia, para que leitores
+        # concorrentes (outras réplicas) nunca vejam um arquivo pela metade
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+
+def _is_missing(value):
+    return value is None or (isinstance(value, float) and np.isnan(value))
+
+
+def _json_default(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _write_parquet(df, f):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    object_columns = [col for col in df.columns if df[col].dtype == object]
+    json_columns = [
+        col for col in object_columns
+        if any(isinstance(value, (list, tuple, dict, np.ndarray)) for value in df[col])
+    ]
+    encoded = df.assign(**{
+        col: [None if _is_missing(value) else json.dumps(value, default=_json_default) for value in df[col]]
+        for col in json_columns
+    })
+
+    table = pa.Table.from_pandas(encoded, preserve_index=False)
+    store_metadata = json.dumps({'object_columns': object_columns, 'json_columns': json_columns})
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                           STORE_METADATA_KEY: store_metadata.encode('utf-8')})
+    pq.write_table(table, f)
+
+
+def _read_parquet(path):
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(path)
+    store_metadata = (table.schema.metadata or {}).get(STORE_METADATA_KEY)
+    df = table.to_pandas()
+    if store_metadata is None:
+        # Arquivos gravados antes dos metadados: só as listas do primeiro nível
+        return _restore_lists(df)
+
+    store_metadata = json.loads(store_metadata)
+    json_columns = set(store_metadata['json_columns'])
+    for col in store_metadata['object_columns']:
+        values = df[col].astype(object)
+        missing = values.isna().to_numpy()
+        if col in json_columns:
+            values = [np.nan if is_missing else json.loads(value) for value, is_missing in zip(values, missing)]
+        else:
+            values = values.where(~missing, np.nan)
+        df[col] = pd.Series(values, index=df.index, dtype=object)
+    return df
+
+
+def _restore_lists(df):
+    # O Parquet devolve colunas de listas (location, pass_end_location, ...)
+    # como arrays NumPy; voltamos para listas, como no statsbombpy
+    for col in df.columns[df.dtypes == object]:
+        values = df[col]
+        first = values.dropna()
+        if not first.empty and isinstance(first.iloc[0], np.ndarray):
+            df[col] = [v.tolist() if isinstance(v, np.ndarray) else v for v in values]
+    return df
+
+
+default_store = EventStore() if EVENT_STORE_DIR else None
@@ -0,0 +1,147 @@
+# export_cards.py
+"""Render every player's profile card outside Streamlit.
+
+Each card has the photo, the profile metrics and the four pitch plots, and
+is written as <out-dir>/<full name>.<fmt>. The individual plots are also
+written to <out-dir>/<full name>/<plot>.png, drawn exactly like the app
+draws them. Cards are rendered in a process pool sized to the machine:
+
+    python export_cards.py --formats png pdf
+
+With BRASIL70_PLOT_CACHE set, the plots are also stored in the app's plot
+cache, so replicas sharing that directory serve them without drawing.
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from io import BytesIO
+
+
+CARDS_DIR = os.path.join('static', 'cards')
+CARD_FORMATS = ('png', 'pdf')
+
+# Ordem e rótulos dos números do cartão, como no perfil do app
+CARD_METRICS = [
+    ('Age', 'age'), ('Matches', 'matches'),
+    ('xG', 'xg'), ('Goals', 'goals'),
+    ('xA', 'xa'), ('Assists', 'assists'),
+    ('Pass xT', 'xt_pass'), ('Carry xT', 'xt_carry'),
+]
+
+
+def load_season(competition_name, season_name):
+    """(event index, player summary, events version) of a season, scored like the app does it."""
+    from profile_config import events_version
+    from utils import (MatchEventsCache, build_event_index, build_player_summary, get_competitions,
+                       get_match_ids)
+
+    competitions = get_competitions()
+    season = competitions[(competitions['competition_name'] == competition_name) &
+                          (competitions['season_name'] == season_name)]
+    if season.empty:
+        raise SystemExit(f"{season_name} {competition_name} data not found.")
+    competition_id, season_id = season.iloc[0][['competition_id', 'season_id']]
+
+    match_ids = tuple(get_match_ids(competition_id, season_id))
+    events = MatchEventsCache().events(competition_id, season_id, match_ids)
+    summary = build_player_summary(events).to_dict('index')
+    return build_event_index(events), summary, events_version(competition_id, season_id, match_ids)
+
+
+def card_metrics(player, stats):
+    values = {'age': player['age'], **stats}
+    return [
+        (label, round(values[key], 2) if key in ('xg', 'xa', 'xt_pass', 'xt_carry') else int(values[key]))
+        for label, key in CARD_METRICS
+    ]
+
+
+def render_card(player, stats, player_events, version, out_dir=CARDS_DIR, formats=CARD_FORMATS, dpi=200):
+    """Write one player's card and plots; returns the paths written."""
+    from matplotlib.figure import Figure
+    from mplsoccer import VerticalPitch as Pitch
+    from PIL import Image
+
+    import utils
+    from profile_config import PLOT_FUNCTIONS, PROFILE_PLOTS
+    from figures import figure_manager, plot_cache
+    from thumbnails import load_thumbnail
+
+    name = player['full_name']
+    plot_dir = os.path.join(out_dir, name)
+    os.makedirs(plot_dir, exist_ok=True)
+    written = []
+
+    # Os mesmos PNGs do perfil, com a mesma chave do cache de gráficos do app
+    for _, plot_name in PROFILE_PLOTS:
+        function_name, _, pitch_style = PLOT_FUNCTIONS[plot_name]
+        data = figure_manager.render(getattr(utils, function_name), player_events, getattr(utils, pitch_style))
+        if plot_cache.cache_dir:
+            plot_cache.put((name, plot_name, version), data)
+        path = os.path.join(plot_dir, f"{plot_name}.png")
+        with open(path, 'wb') as f:
+            f.write(data)
+        written.append(path)
+
+    fig = Figure(figsize=(24, 6.5), layout='constrained')
+    fig.suptitle(player['display_name'], fontsize=24)
+    axes = fig.subplots(1, 6, gridspec_kw={'width_ratios': [1, 0.8, 1, 1, 1, 1]})
+
+    with Image.open(BytesIO(load_thumbnail(name, 'profile', 'jpeg'))) as photo:
+        axes[0].imshow(photo.convert('RGB'))
+    axes[0].axis('off')
+
+    axes[1].axis('off')
+    for i, (label, value) in enumerate(card_metrics(player, stats)):
+        x, y = (i % 2) * 0.5, 1 - (i // 2) * 0.25
+        axes[1].text(x, y, label, fontsize=12, va='top', transform=axes[1].transAxes)
+        axes[1].text(x, y - 0.07, str(value), fontsize=22, va='top', transform=axes[1].transAxes)
+
+    for ax, (subheader, plot_name) in zip(axes[2:], PROFILE_PLOTS):
+        function_name, _, pitch_style = PLOT_FUNCTIONS[plot_name]
+        Pitch(**getattr(utils, pitch_style)).draw(ax=ax)
+        getattr(utils, function_name)(player_events, ax=ax)
+        ax.set_title(subheader, fontsize=16)
+
+    for fmt in formats:
+        path = os.path.join(out_dir, f"{name}.{fmt}")
+        fig.savefig(path, format=fmt, dpi=dpi)
+        written.append(path)
+    return written
+
+
+def export_cards(players, competition_name, season_name, out_dir=CARDS_DIR, formats=CARD_FORMATS, dpi=200, workers=None):
+    """Render the cards of players with data in the season; returns {full name: paths}."""
+    event_index, summary, version = load_season(competition_name, season_name)
+    os.makedirs(out_dir, exist_ok=True)
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = {
+            executor.submit(render_card, player, summary[player['full_name']], event_index.player(player['full_name']),
+                            version, out_dir, formats, dpi): player['full_name']
+            for player in players if player['full_name'] in summary
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
+
+if __name__ == '__main__':
+    from profile_config import SEASONS, players
+
+    parser = argparse.ArgumentParser(description="Render every player's profile card to PNG/PDF.")
+    parser.add_argument('--competition', default=SEASONS[0][0])
+    parser.add_argument('--season', default=SEASONS[0][1])
+    parser.add_argument('--out-dir', default=CARDS_DIR)
+    parser.add_argument('--formats', nargs='+', default=list(CARD_FORMATS), choices=['png', 'pdf', 'svg'])
+    parser.add_argument('--dpi', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=None, help="processes (default: one per CPU)")
+    parser.add_argument('--players', nargs='+', help="full names to export (default: the whole squad)")
+    args = parser.parse_args()
+
+    selected = [player for player in players if not args.players or player['full_name'] in args.players]
+    results = export_cards(selected, args.competition, args.season, args.out_dir, tuple(args.formats),
+                           args.dpi, args.workers)
+    skipped = len(selected) - len(results)
+    print(f"Wrote {len(results)} cards to {args.out_dir}" + (f" ({skipped} players without data)" if skipped else ""))
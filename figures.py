@@ -0,0 +1,184 @@
+# figures.py
+import hashlib
+import os
+import threading
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from io import BytesIO
+
+
+# Incrementar quando o visual dos gráficos mudar, para invalidar o cache em disco
+PLOT_STYLE_VERSION = 2
+
+PLOT_CACHE_DIR = os.environ.get('BRASIL70_PLOT_CACHE', '')
+
+
+def render_figure(fig, fmt='png', dpi=200):
+    """Render a matplotlib figure to bytes and close it."""
+    import matplotlib.pyplot as plt
+
+    buf = BytesIO()
+    try:
+        fig.savefig(buf, format=fmt, dpi=dpi, bbox_inches='tight')
+    finally:
+        plt.close(fig)
+    return buf.getvalue()
+
+
+class PitchFigureManager:
+    """Pool of figures with the pitch already drawn, one pool per pitch style.
+
+    Figures are plain matplotlib Figure objects (not registered with pyplot),
+    so nothing leaks into pyplot's global figure list. After each render the
+    plotted artists are removed and the figure goes back to its pool with
+    the pitch markings intact, or is dropped once the pool is full.
+    """
+
+    def __init__(self, max_pooled=4):
+        self.max_pooled = max_pooled
+        self._pools = defaultdict(list)
+        self._live = 0
+        self._lock = threading.Lock()
+
+    def _new_figure(self, pitch_kwargs):
+        # matplotlib só é importado quando um gráfico precisa ser desenhado
+        from matplotlib import rcParams
+        from matplotlib.figure import Figure
+        from mplsoccer import VerticalPitch as Pitch
+
+        fig = Figure(figsize=rcParams['figure.figsize'], layout='tight')
+        ax = fig.add_subplot()
+        Pitch(**pitch_kwargs).draw(ax=ax)
+        # Tudo o que existe agora é o campo; o resto é removido ao reciclar
+        fig.pitch_artists = set(ax.get_children())
+        fig.pitch_limits = (ax.get_xlim(), ax.get_ylim())
+        return fig
+
+    def acquire(self, pitch_kwargs=None):
+        style = tuple(sorted((pitch_kwargs or {}).items()))
+        with self._lock:
+            pool = self._pools[style]
+            fig = pool.pop() if pool else None
+            self._live += 1
+        if fig is None:
+            fig = self._new_figure(dict(style))
+        fig.pitch_style = style
+        return fig, fig.axes[0]
+
+    def release(self, fig):
+        ax = fig.axes[0]
+        for artist in ax.get_children():
+            if artist not in fig.pitch_artists:
+                artist.remove()
+        ax.set_title('')
+        ax.set_xlim(fig.pitch_limits[0])
+        ax.set_ylim(fig.pitch_limits[1])
+
+        with self._lock:
+            self._live -= 1
+            pool = self._pools[fig.pitch_style]
+            if len(pool) < self.max_pooled:
+                pool.append(fig)
+
+    @contextmanager
+    def figure(self, pitch_kwargs=None):
+        fig, ax = self.acquire(pitch_kwargs)
+        try:
+            yield fig, ax
+        finally:
+            self.release(fig)
+
+    def render(self, plot_function, events, pitch_kwargs=None, fmt='png', dpi=200):
+        """Draw plot_function(events, ax=ax) on a pooled pitch and return the bytes."""
+        with self.figure(pitch_kwargs) as (fig, ax):
+            plot_function(events, ax=ax)
+            buf = BytesIO()
+            fig.savefig(buf, format=fmt, dpi=dpi, bbox_inches='tight')
+        return buf.getvalue()
+
+    def live_figures(self):
+        """Figures currently in use, plus any left open in pyplot."""
+        import matplotlib.pyplot as plt
+
+        with self._lock:
+            in_use = self._live
+        return in_use + len(plt.get_fignums())
+
+    def pooled_figures(self):
+        with self._lock:
+            return sum(len(pool) for pool in self._pools.values())
+
+
+class FigureCache:
+    """LRU cache of rendered figures, optionally mirrored on disk.
+
+    Keys are tuples such as (player, plot name, data version); values are
+    the PNG/SVG bytes, so a hit never touches matplotlib.
+    """
+
+    def __init__(self, max_entries=256, cache_dir=None, fmt='png'):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.fmt = fmt
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _disk_path(self, key):
+        digest = hashlib.sha1(repr((PLOT_STYLE_VERSION, key)).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.{self.fmt}")
+
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        if self.cache_dir:
+            path = self._disk_path(key)
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    data = f.read()
+                self._store(key, data)
+                with self._lock:
+                    self.hits += 1
+                return data
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, data):
+        self._store(key, data)
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._disk_path(key)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+    def _store(self, key, data):
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_render(self, key, render):
+        """Return cached bytes for key, calling render() for the bytes on a miss."""
+        data = self.get(key)
+        if data is None:
+            data = render()
+            self.put(key, data)
+        return data
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+figure_manager = PitchFigureManager()
+plot_cache = FigureCache(cache_dir=PLOT_CACHE_DIR or None)
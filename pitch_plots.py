@@ -0,0 +1,136 @@
+# pitch_plots.py
+"""Profile plots drawn from plain coordinate arrays.
+
+utils.plot_* extract the coordinates from an events table and draw them
+with these functions; the artifact mode of the app (see player_artifacts)
+calls them directly with the arrays stored per player, without any events
+table.
+"""
+import numpy as np
+from mplsoccer import VerticalPitch as Pitch
+
+
+# Estilo de campo de cada gráfico, usado também para reaproveitar figuras
+DEFAULT_PITCH = {}
+RECEPTION_PITCH = {'line_zorder': 2}
+
+
+def draw_pitch(ax=None, **pitch_kwargs):
+    pitch = Pitch(**pitch_kwargs)
+    if ax is None:
+        fig, ax = pitch.draw()
+    else:
+        # O campo já foi desenhado neste eixo (ver figures.PitchFigureManager)
+        fig = ax.figure
+    return pitch, fig, ax
+
+
+def _array(data, key, dtype=float):
+    return np.asarray(data[key], dtype=dtype)
+
+
+def draw_arrows(data, title='', ax=None, width=1, key_width=2):
+    """Arrows from (x, y) to (end_x, end_y), with the key ones highlighted."""
+    pitch, fig, ax = draw_pitch(ax, **DEFAULT_PITCH)
+
+    x, y = _array(data, 'x'), _array(data, 'y')
+    if not len(x):
+        return fig
+    end_x, end_y = _array(data, 'end_x'), _array(data, 'end_y')
+
+    pitch.arrows(x, y, end_x, end_y, ax=ax, width=width, color='black', alpha=0.2)
+
+    key = _array(data, 'key', bool)
+    if not key.any():
+        return fig
+
+    pitch.arrows(x[key], y[key], end_x[key], end_y[key], ax=ax, width=key_width, color='black', alpha=0.8)
+    ax.set_title(title)
+
+    return fig
+
+
+def draw_passes(data, title='', ax=None):
+    return draw_arrows(data, title, ax, width=1)
+
+
+def draw_carries(data, title='', ax=None):
+    return draw_arrows(data, title, ax, width=1.5)
+
+
+def smooth_density(grid, sigma):
+    # Suavização gaussiana separável (uma passada 1D por eixo, em C), com zeros
+    # fora do campo; mantém o tamanho da grade mesmo quando ela é menor que o kernel
+    from scipy.ndimage import gaussian_filter
+
+    return gaussian_filter(np.asarray(grid, dtype=float), sigma, mode='constant', truncate=3.0)
+
+
+def draw_reception_actions(data, title='', mode='fast', bins=(120, 80), sigma=4, thresh=0.5, ax=None):
+    """Density of a player's ball receipts.
+
+    mode='fast' bins the receipts on a fixed pitch grid, smooths it with a
+    separable Gaussian and draws it with a single pcolormesh; mode='kde'
+    keeps the original seaborn KDE look.
+    """
+    pitch, fig, ax = draw_pitch(ax, **RECEPTION_PITCH)
+
+    x, y = _array(data, 'x'), _array(data, 'y')
+    if not len(x):
+        return fig
+
+    if mode == 'kde':
+        pitch.kdeplot(x, y, ax=ax, cmap='Greys', alpha=1, thresh=thresh, shade=True,
+                      levels=100, n_levels=10, cut=1, zorder=1, fill=True)
+    else:
+        stats = pitch.bin_statistic(x, y, statistic='count', bins=bins)
+        density = smooth_density(np.nan_to_num(stats['statistic']), sigma)
+
+        # Como o thresh do seaborn: esconde a região que concentra a fração
+        # thresh menos densa da massa total
+        values = np.sort(density.ravel())
+        cumulative = np.cumsum(values) / values.sum()
+        level = values[min(np.searchsorted(cumulative, thresh), len(values) - 1)]
+        stats['statistic'] = np.where(density >= level, density, np.nan)
+
+        pitch.heatmap(stats, ax=ax, cmap='Greys', vmin=level, zorder=1)
+
+    ax.set_title(title)
+    return fig
+
+
+def draw_shots(data, title='', ax=None):
+    pitch, fig, ax = draw_pitch(ax, **DEFAULT_PITCH)
+
+    x, y = _array(data, 'x'), _array(data, 'y')
+    if not len(x):
+        return fig
+
+    # Tamanho do ponto proporcional ao xG, com um mínimo para continuar visível
+    size = np.maximum(_array(data, 'xg'), 0.075) * 250
+    goal = _array(data, 'goal', bool)
+
+    if (~goal).any():
+        pitch.scatter(x[~goal], y[~goal], ax=ax, edgecolors='black', c='black', s=size[~goal], alpha=0.25)
+
+    if goal.any():
+        pitch.scatter(x[goal], y[goal], ax=ax, edgecolors='black', c='black', s=size[goal], alpha=1)
+
+    ax.set_title(title)
+
+    return fig
+
+
+def draw_small_multiples(draw_function, data_by_title, pitch_kwargs=None, panel_size=(3.2, 4.6)):
+    """One pitch per (title, data) pair, side by side, drawn with draw_function."""
+    from matplotlib.figure import Figure
+
+    n = max(len(data_by_title), 1)
+    fig = Figure(figsize=(panel_size[0] * n, panel_size[1]), layout='constrained')
+    axes = fig.subplots(1, n, squeeze=False)[0]
+    for ax, (title, data) in zip(axes, data_by_title.items()):
+        Pitch(**(pitch_kwargs or {})).draw(ax=ax)
+        draw_function(data, ax=ax)
+        # As funções de desenho só põem título quando há eventos em destaque
+        ax.set_title(title)
+    return fig
@@ -0,0 +1,117 @@
+# player_artifacts.py
+"""Per-player profile artifacts: the profile metrics plus the plot coordinates.
+
+Build them with ``python player_artifacts.py``; each player of the season
+gets <root>/<competition>/<season>/<full name>.json. With
+BRASIL70_DATA_MODE=artifacts the app renders profiles from these files
+alone, so a serving replica never imports statsbombpy or holds the events
+table.
+"""
+import argparse
+import os
+
+try:
+    import orjson
+
+    def _parse_json(data):
+        return orjson.loads(data)
+
+    def _dump_json(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+
+    def _parse_json(data):
+        return json.loads(data)
+
+    def _dump_json(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+ARTIFACTS_DIR = os.environ.get('BRASIL70_ARTIFACTS', os.path.join('data', 'artifacts'))
+ARTIFACT_VERSION = 1
+
+# Coordenadas do StatsBomb têm uma casa decimal; duas bastam para o xG dos chutes
+COORDINATE_DECIMALS = 2
+COUNT_METRICS = ('matches', 'passes', 'assists', 'shots', 'goals')
+
+
+def artifact_path(competition_name, season_name, player_name, root=ARTIFACTS_DIR):
+    file_name = player_name.replace(os.sep, '_') + '.json'
+    return os.path.join(root, competition_name, season_name, file_name)
+
+
+def _compact(values):
+    # Só usado no build; quem serve os artefatos não importa NumPy
+    import numpy as np
+
+    values = np.asarray(values)
+    if values.dtype == bool:
+        return values.tolist()
+    # NaN vira null no JSON
+    values = np.round(values.astype(float), COORDINATE_DECIMALS)
+    return [None if np.isnan(v) else v for v in values.tolist()]
+
+
+def build_player_artifact(player_name, stats, player_events, competition_name, season_name, events_version):
+    from utils import plot_data
+
+    return {
+        'version': ARTIFACT_VERSION,
+        'player': player_name,
+        'competition': competition_name,
+        'season': season_name,
+        'events_version': events_version,
+        'metrics': {
+            key: int(value) if key in COUNT_METRICS else float(value) for key, value in stats.items()
+        },
+        'plots': {
+            plot_name: {key: _compact(values) for key, values in data.items()}
+            for plot_name, data in plot_data(player_events).items()
+        },
+    }
+
+
+def write_artifact(artifact, root=ARTIFACTS_DIR):
+    path = artifact_path(artifact['competition'], artifact['season'], artifact['player'], root)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_dump_json(artifact))
+    os.replace(tmp_path, path)
+    return path
+
+
+def build_artifacts(competition_name, season_name, root=ARTIFACTS_DIR):
+    """Write the artifact of every player with events in the season; returns the paths."""
+    from export_cards import load_season
+
+    event_index, summary, events_version = load_season(competition_name, season_name)
+    return [
+        write_artifact(build_player_artifact(player_name, stats, event_index.player(player_name),
+                                             competition_name, season_name, events_version), root)
+        for player_name, stats in summary.items()
+    ]
+
+
+def load_artifact(competition_name, season_name, player_name, root=ARTIFACTS_DIR):
+    """The player's artifact, or None if it was not built (or is from an older format)."""
+    try:
+        with open(artifact_path(competition_name, season_name, player_name, root), 'rb') as f:
+            artifact = _parse_json(f.read())
+    except FileNotFoundError:
+        return None
+    return artifact if artifact.get('version') == ARTIFACT_VERSION else None
+
+
+if __name__ == '__main__':
+    from profile_config import SEASONS
+
+    parser = argparse.ArgumentParser(description="Write the per-player profile artifacts of a season.")
+    parser.add_argument('--competition', default=SEASONS[0][0])
+    parser.add_argument('--season', default=SEASONS[0][1])
+    parser.add_argument('--out-dir', default=ARTIFACTS_DIR)
+    args = parser.parse_args()
+
+    paths = build_artifacts(args.competition, args.season, args.out_dir)
+    print(f"Wrote {len(paths)} player artifacts to {os.path.join(args.out_dir, args.competition, args.season)}")
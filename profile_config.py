@@ -0,0 +1,86 @@
+# profile_config.py
+"""Squad, seasons and profile plots shared by the app and the command-line tools.
+
+Only the standard library is imported here, so export_cards.py,
+player_artifacts.py and the other CLIs can use it without running the
+Streamlit app module.
+"""
+import os
+import zlib
+
+
+# Competitions and seasons available in the profile, as (competition name, season name).
+# BRASIL70_SEASONS overrides it, e.g. "FIFA World Cup:1970;FIFA World Cup:1974"
+def parse_seasons(value):
+    """[(competition name, season name)] from "Competition:Season;Competition:Season"."""
+    seasons = []
+    for entry in value.split(';'):
+        if not entry.strip():
+            continue
+        competition_name, _, season_name = entry.partition(':')
+        if not competition_name.strip() or not season_name.strip():
+            raise ValueError(f"BRASIL70_SEASONS entries must look like 'FIFA World Cup:1970', got {entry!r}")
+        seasons.append((competition_name.strip(), season_name.strip()))
+    return seasons
+
+
+SEASONS = parse_seasons(os.environ.get('BRASIL70_SEASONS', '')) or [('FIFA World Cup', '1970')]
+
+POSITION_GROUPS = [
+    ('Goalkeepers', 'Goalkeeper'),
+    ('Defenders', 'Defender'),
+    ('Midfielders', 'Midfielder'),
+    ('Forwards', 'Forward'),
+]
+
+# Profile plots: plot function in utils (from events), draw function and pitch style
+# in pitch_plots (from coordinates), resolved on first use
+PLOT_FUNCTIONS = {
+    'receipts': ('plot_reception_actions', 'draw_reception_actions', 'RECEPTION_PITCH'),
+    'carries': ('plot_carries', 'draw_carries', 'DEFAULT_PITCH'),
+    'passes': ('plot_passes', 'draw_passes', 'DEFAULT_PITCH'),
+    'shots': ('plot_shots', 'draw_shots', 'DEFAULT_PITCH'),
+}
+# Profile plots, in display order
+PROFILE_PLOTS = [
+    ('Ball Receipts', 'receipts'),
+    ('Carries', 'carries'),
+    ('Passes', 'passes'),
+    ('Shots', 'shots'),
+]
+
+# Player data
+players = [
+    {'display_name': 'Ado', 'full_name': 'Eduardo Roberto Stinghen', 'age': 23, 'position': 'Goalkeeper'},
+    {'display_name': 'Émerson Leão', 'full_name': 'Emerson Leão', 'age': 20, 'position': 'Goalkeeper'},
+    {'display_name': 'Félix', 'full_name': 'Félix Miéli Venerando', 'age': 32, 'position': 'Goalkeeper'},
+    {'display_name': 'Carlos Alberto', 'full_name': 'Carlos Alberto Torres', 'age': 25, 'position': 'Defender'},
+    {'display_name': 'Brito', 'full_name': 'Hercules Brito Ruas', 'age': 30, 'position': 'Defender'},
+    {'display_name': 'Piazza', 'full_name': 'Wilson da Silva Piazza', 'age': 26, 'position': 'Defender'},
+    {'display_name': 'Everaldo', 'full_name': 'Everaldo Marques da Silva', 'age': 25, 'position': 'Defender'},
+    {'display_name': 'Zé Maria', 'full_name': 'José Maria Rodrigues Alves', 'age': 21, 'position': 'Defender'},
+    {'display_name': 'Fontana', 'full_name': 'José de Anchieta Fontana', 'age': 29, 'position': 'Defender'},
+    {'display_name': 'Baldocchi', 'full_name': 'José Guilherme Baldocchi', 'age': 24, 'position': 'Defender'},
+    {'display_name': 'Joel Camargo', 'full_name': 'Joel Camargo', 'age': 23, 'position': 'Defender'},
+    {'display_name': 'Marco Antônio', 'full_name': 'Marco Antônio Feliciano', 'age': 19, 'position': 'Defender'},
+    {'display_name': 'Clodoaldo', 'full_name': 'Clodoaldo Tavares de Santana', 'age': 20, 'position': 'Midfielder'},
+    {'display_name': 'Gérson', 'full_name': 'Gérson de Oliveira Nunes', 'age': 29, 'position': 'Midfielder'},
+    {'display_name': 'Rivellino', 'full_name': 'Roberto Rivelino', 'age': 24, 'position': 'Midfielder'},
+    {'display_name': 'Pelé', 'full_name': 'Édson Arantes do Nascimento', 'age': 29, 'position': 'Midfielder'},
+    {'display_name': 'Paulo Cézar Caju', 'full_name': 'Paulo Cézar Lima', 'age': 20, 'position': 'Midfielder'},
+    {'display_name': 'Jairzinho', 'full_name': 'Jair Ventura Filho', 'age': 25, 'position': 'Forward'},
+    {'display_name': 'Tostão', 'full_name': 'Eduardo Gonçalves de Andrade', 'age': 23, 'position': 'Forward'},
+    {'display_name': 'Roberto Miranda', 'full_name': 'Roberto Lopes de Miranda', 'age': 25, 'position': 'Forward'},
+    {'display_name': 'Edu', 'full_name': 'Jonas Eduardo Américo', 'age': 20, 'position': 'Forward'},
+    {'display_name': 'Dadá Maravilha', 'full_name': 'Dario José dos Santos', 'age': 24, 'position': 'Forward'},
+]
+
+
+def players_by_position(position):
+    """Get players filtered by position."""
+    return [player for player in players if player['position'] == position]
+
+
+def events_version(competition_id, season_id, match_ids):
+    """Version of a season's events, part of the plot cache keys; changes when matches are added."""
+    return f"{competition_id}-{season_id}-{zlib.crc32(repr(tuple(match_ids)).encode()):08x}"
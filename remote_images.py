@@ -0,0 +1,153 @@
+# remote_images.py
+"""Remote player photo loader.
+
+One shared requests.Session (connection pool) for every download, an on-disk
+cache revalidated with ETag/Last-Modified, and a concurrent batch API to
+fetch a whole squad at once.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+IMAGE_CACHE_DIR = os.environ.get('BRASIL70_IMAGE_CACHE', os.path.join('data', 'image_cache'))
+
+# Fotos da Wikimedia usadas originalmente pelo old_app.py
+PLAYER_IMAGE_URLS = {
+    'Carlos Alberto Torres': 'https://upload.wikimedia.org/wikipedia/commons/thumb/6/67/Carlos_Alberto_%281970%29.jpg/220px-Carlos_Alberto_%281970%29.jpg',
+    'Clodoaldo Tavares de Santana': 'https://upload.wikimedia.org/wikipedia/commons/thumb/2/2d/Clodoaldo_1970.jpg/220px-Clodoaldo_1970.jpg',
+    'Dario José dos Santos': 'https://upload.wikimedia.org/wikipedia/commons/c/c9/Dad%C3%A1_Maravilha_%281970%29.jpg',
+    'Eduardo Gonçalves de Andrade': 'https://upload.wikimedia.org/wikipedia/commons/thumb/6/67/Tost%C3%A3o_%28Eduardo_Gon%C3%A7alves_de_Andrade%2C_1970%29.jpg/640px-Tost%C3%A3o_%28Eduardo_Gon%C3%A7alves_de_Andrade%2C_1970%29.jpg',
+    'Eduardo Roberto Stinghen': 'https://upload.wikimedia.org/wikipedia/commons/8/82/Eduardo_Roberto_Stinghen.jpg',
+    'Emerson Leão': 'https://upload.wikimedia.org/wikipedia/commons/thumb/c/c3/%C3%89merson_Le%C3%A3o.jpg/220px-%C3%89merson_Le%C3%A3o.jpg',
+    'Everaldo Marques da Silva': 'https://upload.wikimedia.org/wikipedia/commons/2/20/Everaldo_Marques_da_Silva.jpg',
+    'Félix Miéli Venerando': 'https://upload.wikimedia.org/wikipedia/commons/thumb/f/fe/F%C3%A9lix_Brasil.jpg/220px-F%C3%A9lix_Brasil.jpg',
+    'Gérson de Oliveira Nunes': 'https://upload.wikimedia.org/wikipedia/commons/thumb/3/34/G%C3%A9rson_1970.jpg/1200px-G%C3%A9rson_1970.jpg',
+    'Hercules Brito Ruas': 'https://upload.wikimedia.org/wikipedia/commons/thumb/a/a7/H%C3%A9rcules_de_Brito_Ruas.jpg/330px-H%C3%A9rcules_de_Brito_Ruas.jpg',
+    'Jair Ventura Filho': 'https://upload.wikimedia.org/wikipedia/commons/thumb/e/e7/Jairzinho_%28Jair_Ventura_Filho%2C_1970%29.jpg/150px-Jairzinho_%28Jair_Ventura_Filho%2C_1970%29.jpg',
+    'Joel Camargo': 'https://upload.wikimedia.org/wikipedia/commons/1/1d/Joel_Camargo_%281970%29.jpg',
+    'Jonas Eduardo Américo': 'https://upload.wikimedia.org/wikipedia/commons/thumb/a/a7/Edu_1970.jpg/220px-Edu_1970.jpg',
+    'José Guilherme Baldocchi': 'https://upload.wikimedia.org/wikipedia/commons/thumb/5/59/Baldocchi_%281970%29.jpg/227px-Baldocchi_%281970%29.jpg',
+    'José Maria Rodrigues Alves': 'https://upload.wikimedia.org/wikipedia/commons/1/14/Z%C3%A9_Maria_1970.png',
+    'José de Anchieta Fontana': 'https://upload.wikimedia.org/wikipedia/commons/0/0c/Jos%C3%A9_de_Anchieta_Fontana_%281970%29.jpg',
+    'Marco Antônio Feliciano': 'https://upload.wikimedia.org/wikipedia/commons/thumb/7/71/Marco_Ant%C3%B4nio_%281974%29.jpg/230px-Marco_Ant%C3%B4nio_%281974%29.jpg',
+    'Paulo Cézar Lima': 'https://upload.wikimedia.org/wikipedia/commons/thumb/1/14/Caju_1978.jpg/1200px-Caju_1978.jpg',
+    'Roberto Lopes de Miranda': 'https://upload.wikimedia.org/wikipedia/commons/d/d2/Roberto_Miranda_%281970%29%2C_%27Mexico_70%27%2C_Panini_figurina.jpg',
+    'Roberto Rivelino': 'https://upload.wikimedia.org/wikipedia/commons/d/df/Rivelino_brasil_figurita.jpg',
+    'Wilson da Silva Piazza': 'https://upload.wikimedia.org/wikipedia/commons/thumb/8/8f/Wilson_Piazza.jpg/220px-Wilson_Piazza.jpg',
+    'Édson Arantes do Nascimento': 'https://upload.wikimedia.org/wikipedia/commons/thumb/b/b8/Panini_pele_photo_only.jpg/160px-Panini_pele_photo_only.jpg',
+}
+
+
+def new_session(pool_size=16, retries=2):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    # A Wikimedia recusa clientes sem User-Agent identificável
+    session.headers['User-Agent'] = 'brasil70/1.0 (https://github.com/leomsafreire/brasil_70)'
+    return session
+
+
+class RemoteImageLoader:
+    """Fetch image bytes over a pooled session, caching them on disk.
+
+    Cached copies are revalidated with If-None-Match / If-Modified-Since, so
+    an unchanged photo costs a 304 and no body. If the server cannot be
+    reached or answers with a 5xx, the cached copy is served as is.
+    """
+
+    def __init__(self, cache_dir=IMAGE_CACHE_DIR, session=None, timeout=10, max_workers=8):
+        self.cache_dir = cache_dir
+        self.session = session or new_session(pool_size=max_workers)
+        self.timeout = timeout
+        self.max_workers = max_workers
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.img"), os.path.join(self.cache_dir, f"{key}.json")
+
+    def _read_cache(self, url):
+        if not self.cache_dir:
+            return None, {}
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                return f.read(), meta
+        except (FileNotFoundError, ValueError):
+            return None, {}
+
+    def _write_cache(self, url, content, response):
+        if not self.cache_dir:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        body_path, meta_path = self._paths(url)
+        meta = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+        for path, data in ((body_path, content), (meta_path, json.dumps(meta).encode('utf-8'))):
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+    def fetch(self, url):
+        """Bytes of the resource at url, from the cache when still valid."""
+        cached, meta = self._read_cache(url)
+
+        headers = {}
+        if cached is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+        except requests.RequestException:
+            if cached is not None:
+                return cached
+            raise
+
+        if response.status_code == 304 and cached is not None:
+            return cached
+        # Servidor com problema (5xx) conta como fora do ar quando há cópia local
+        if response.status_code >= 500 and cached is not None:
+            return cached
+        response.raise_for_status()
+
+        self._write_cache(url, response.content, response)
+        return response.content
+
+    def fetch_many(self, urls):
+        """Fetch urls concurrently; returns {url: bytes}, with None for failures."""
+        urls = list(dict.fromkeys(urls))
+
+        def fetch_or_none(url):
+            try:
+                return self.fetch(url)
+            except (requests.RequestException, OSError):
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(urls)))) as executor:
+            return dict(zip(urls, executor.map(fetch_or_none, urls)))
+
+
+default_loader = RemoteImageLoader()
+
+
+def fetch_squad_photos(full_names=None, loader=None):
+    """Photo bytes of every player in PLAYER_IMAGE_URLS (or of full_names), by full name."""
+    loader = loader or default_loader
+    full_names = list(PLAYER_IMAGE_URLS) if full_names is None else full_names
+    photos = loader.fetch_many(PLAYER_IMAGE_URLS[name] for name in full_names)
+    return {name: photos[PLAYER_IMAGE_URLS[name]] for name in full_names}
@@ -0,0 +1,202 @@
+# telemetry.py
+"""Lightweight timing spans and cache counters for the app.
+
+Every span is logged as one JSON line on the 'telemetry' logger and added to
+a process-wide registry, which renders in the Prometheus text format
+(written to BRASIL70_METRICS_FILE and/or served on BRASIL70_METRICS_PORT at
+/metrics). Spans and cache lookups made while a Trace is active are also
+kept on that trace, so the app can show what the current rerun spent.
+
+Only the standard library is imported here, so the home page can use it.
+"""
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+METRICS_FILE = os.environ.get('BRASIL70_METRICS_FILE', '')
+METRICS_PORT = int(os.environ.get('BRASIL70_METRICS_PORT', 0) or 0)
+METRICS_PREFIX = 'brasil70'
+
+logger = logging.getLogger('telemetry')
+
+_current_trace = contextvars.ContextVar('brasil70_trace', default=None)
+
+
+class Registry:
+    """Process-wide totals per stage and per cache, shared by all sessions."""
+
+    def __init__(self):
+        self._stages = defaultdict(lambda: [0, 0.0])
+        self._caches = defaultdict(lambda: [0, 0])
+        self._lock = threading.Lock()
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            totals = self._stages[stage]
+            totals[0] += 1
+            totals[1] += seconds
+
+    def cache_lookup(self, cache):
+        with self._lock:
+            self._caches[cache][0] += 1
+
+    def cache_miss(self, cache):
+        with self._lock:
+            self._caches[cache][1] += 1
+
+    def prometheus_text(self):
+        with self._lock:
+            stages = {stage: tuple(totals) for stage, totals in self._stages.items()}
+            caches = {cache: tuple(totals) for cache, totals in self._caches.items()}
+
+        lines = [
+            f"# HELP {METRICS_PREFIX}_stage_seconds Time spent in each app stage.",
+            f"# TYPE {METRICS_PREFIX}_stage_seconds summary",
+        ]
+        for stage, (count, seconds) in sorted(stages.items()):
+            lines.append(f'{METRICS_PREFIX}_stage_seconds_count{{stage="{stage}"}} {count}')
+            lines.append(f'{METRICS_PREFIX}_stage_seconds_sum{{stage="{stage}"}} {seconds:.6f}')
+        lines += [
+            f"# HELP {METRICS_PREFIX}_cache_requests_total Cache lookups by result.",
+            f"# TYPE {METRICS_PREFIX}_cache_requests_total counter",
+        ]
+        for cache, (lookups, misses) in sorted(caches.items()):
+            lines.append(f'{METRICS_PREFIX}_cache_requests_total{{cache="{cache}",result="hit"}} {lookups - misses}')
+            lines.append(f'{METRICS_PREFIX}_cache_requests_total{{cache="{cache}",result="miss"}} {misses}')
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path=METRICS_FILE):
+        """Atomically write the Prometheus text to path (e.g. for node_exporter's textfile collector)."""
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp_path, path)
+
+
+class Trace:
+    """Spans and cache lookups of one rerun, in the order they happened."""
+
+    def __init__(self, name='rerun'):
+        self.name = name
+        self.id = uuid.uuid4().hex[:8]
+        self.spans = []
+        self.caches = defaultdict(lambda: [0, 0])
+
+    def stage_totals(self):
+        """(stage, count, seconds) per stage, in order of first appearance."""
+        totals = {}
+        for stage, _, seconds in self.spans:
+            count, total = totals.get(stage, (0, 0.0))
+            totals[stage] = (count + 1, total + seconds)
+        return [(stage, count, seconds) for stage, (count, seconds) in totals.items()]
+
+    def cache_rates(self):
+        """{cache: (hits, lookups)} for this rerun."""
+        return {cache: (lookups - misses, lookups) for cache, (lookups, misses) in self.caches.items()}
+
+
+registry = Registry()
+
+
+def start_trace(name='rerun'):
+    """Make a new Trace current for this thread (each Streamlit session reruns on its own)."""
+    trace = Trace(name)
+    _current_trace.set(trace)
+    return trace
+
+
+def current_trace():
+    return _current_trace.get()
+
+
+@contextmanager
+def span(stage, **labels):
+    """Time a block as one occurrence of stage; labels only go to the log line."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        registry.observe(stage, seconds)
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.spans.append((stage, labels, seconds))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps({
+                'event': 'span',
+                'trace': trace.id if trace is not None else None,
+                'stage': stage,
+                'duration_ms': round(seconds * 1000, 3),
+                **labels,
+            }, ensure_ascii=False, default=str))
+
+
+def record_cache_lookup(cache):
+    registry.cache_lookup(cache)
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.caches[cache][0] += 1
+
+
+def record_cache_miss(cache):
+    registry.cache_miss(cache)
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.caches[cache][1] += 1
+
+
+def traced_cache(cache, cache_decorator):
+    """Apply cache_decorator (e.g. st.cache_data) and count its lookups and misses.
+
+    A miss is recorded when the wrapped function body actually runs.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def compute(*args, **kwargs):
+            record_cache_miss(cache)
+            return func(*args, **kwargs)
+
+        cached = cache_decorator(compute)
+
+        @functools.wraps(func)
+        def lookup(*args, **kwargs):
+            record_cache_lookup(cache)
+            return cached(*args, **kwargs)
+
+        lookup.clear = cached.clear
+        return lookup
+
+    return decorate
+
+
+def serve_metrics(port=METRICS_PORT, host='0.0.0.0'):
+    """Serve /metrics on a daemon thread; returns the server."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = registry.prometheus_text().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug(format, *args)
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name='brasil70-metrics', daemon=True).start()
+    return server
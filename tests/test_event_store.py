@@ -0,0 +1,38 @@
+# tests/test_event_store.py
+"""EventStore round trips: frames read back like the network returned them."""
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic_events import make_match_events
+from event_store import EventStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return EventStore(str(tmp_path))
+
+
+def test_events_round_trip_unchanged(store):
+    events = make_match_events(3_800_000, n_events=500)
+    store.write_events(43, 51, 3_800_000, events)
+
+    restored = store.read_events(43, 51, 3_800_000)
+    pd.testing.assert_frame_equal(restored, events)
+    # Valores aninhados voltam como dict/list com os tipos originais
+    tactics = restored['tactics'].dropna().iloc[0]
+    assert tactics == {'formation': 442, 'lineup': []}
+    assert isinstance(tactics['formation'], int)
+
+
+def test_files_without_store_metadata_still_read(store, tmp_path):
+    events = make_match_events(3_800_001, n_events=200)
+    path = store._path(43, 51, 3_800_001)
+    (tmp_path / '43' / '51').mkdir(parents=True)
+    events.to_parquet(path, index=False)
+
+    restored = store.read_events(43, 51, 3_800_001)
+    assert isinstance(restored['location'].iloc[0], list)
+
+
+def test_missing_file_reads_as_none(store):
+    assert store.read_events(43, 51, 1) is None
@@ -0,0 +1,101 @@
+# tests/test_remote_images.py
+"""RemoteImageLoader against a local http.server stand-in for Wikimedia."""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from remote_images import RemoteImageLoader, new_session
+
+PHOTO = b'\xff\xd8\xff\xe0 not really a jpeg'
+ETAG = '"photo-v1"'
+
+
+class PhotoHandler(BaseHTTPRequestHandler):
+    # Estado compartilhado pelo servidor de teste
+    status = 200
+    requests_seen = []
+
+    def do_GET(self):
+        self.requests_seen.append((self.path, self.headers.get('If-None-Match')))
+        if self.status != 200:
+            self.send_error(self.status)
+        elif self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.send_header('ETag', ETAG)
+            self.end_headers()
+        else:
+            self.send_response(200)
+            self.send_header('ETag', ETAG)
+            self.send_header('Content-Type', 'image/jpeg')
+            self.send_header('Content-Length', str(len(PHOTO)))
+            self.end_headers()
+            self.wfile.write(PHOTO)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    PhotoHandler.status = 200
+    PhotoHandler.requests_seen = []
+    # Porta efêmera escolhida pelo sistema
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PhotoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def loader(tmp_path):
+    return RemoteImageLoader(cache_dir=str(tmp_path), session=new_session(retries=0), timeout=2)
+
+
+def photo_url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}/pele.jpg"
+
+
+def test_fetch_caches_and_revalidates_with_etag(server, loader):
+    url = photo_url(server)
+
+    assert loader.fetch(url) == PHOTO
+    assert loader.fetch(url) == PHOTO
+    # A segunda busca manda o ETag salvo e recebe 304, sem corpo
+    assert PhotoHandler.requests_seen == [('/pele.jpg', None), ('/pele.jpg', ETAG)]
+
+
+def test_fetch_serves_cached_copy_on_server_error(server, loader):
+    url = photo_url(server)
+    loader.fetch(url)
+
+    PhotoHandler.status = 503
+    assert loader.fetch(url) == PHOTO
+
+
+def test_fetch_serves_cached_copy_when_server_is_down(server, loader):
+    url = photo_url(server)
+    loader.fetch(url)
+
+    server.shutdown()
+    server.server_close()
+    assert loader.fetch(url) == PHOTO
+
+
+def test_fetch_without_cached_copy_raises(server, loader):
+    PhotoHandler.status = 503
+    with pytest.raises(requests.HTTPError):
+        loader.fetch(photo_url(server))
+
+
+def test_fetch_many_maps_failures_to_none(server, loader):
+    url = photo_url(server)
+    missing = f"http://127.0.0.1:{server.server_address[1]}/missing.jpg"
+    photos = loader.fetch_many([url, url])
+    assert photos == {url: PHOTO}
+
+    PhotoHandler.status = 404
+    assert loader.fetch_many([missing]) == {missing: None}
@@ -0,0 +1,55 @@
+# tests/test_xt_model.py
+"""Fitted xT grids, and their use by compute_xT / calculate_xT."""
+import numpy as np
+import pytest
+
+from benchmarks.synthetic_events import BENCH_PLAYER, make_competition_events
+from utils import calculate_xT, compute_xT, load_xt_grid, normalize_events
+from xt_model import fit_xt_surfaces, register_fitted_xt_grid
+
+
+@pytest.fixture(scope='module')
+def events():
+    # Pontuados com a grade padrão, como saem do MatchEventsCache
+    return compute_xT(normalize_events(make_competition_events(4)))
+
+
+def dense_xt(surfaces, n_cells):
+    # Referência: matriz de transição densa e iteração de valor ingênua
+    from_cell, to_cell, probability = surfaces['transitions']
+    transitions = np.zeros((n_cells, n_cells))
+    np.add.at(transitions, (from_cell, to_cell), probability)
+    payoff = (surfaces['shoot'] * surfaces['goal']).ravel()
+    move = surfaces['move'].ravel()
+    xt = np.zeros(n_cells)
+    for _ in range(surfaces['iterations']):
+        xt = payoff + move * (transitions @ xt)
+    return xt
+
+
+def test_fit_matches_dense_value_iteration(events):
+    surfaces = fit_xt_surfaces(events, 16, 12)
+
+    assert surfaces['xt'].shape == (12, 16)
+    np.testing.assert_allclose(surfaces['xt'].ravel(), dense_xt(surfaces, 16 * 12), atol=1e-12)
+    # Probabilidades de chutar e de mover somam 1 nas células com ações
+    acted = (surfaces['shoot'] + surfaces['move']) > 0
+    np.testing.assert_allclose((surfaces['shoot'] + surfaces['move'])[acted], 1)
+
+
+def test_fitted_grid_is_registered_once(events):
+    name = register_fitted_xt_grid(events, 'test-dataset', 16, 12)
+
+    # Mesma base e tamanho: não olha os eventos de novo
+    assert register_fitted_xt_grid(None, 'test-dataset', 16, 12) == name
+    assert load_xt_grid(name).shape == (12, 16)
+    assert not load_xt_grid(name).flags.writeable
+
+
+def test_fitted_grid_rescores_scored_events(events):
+    name = register_fitted_xt_grid(events, 'test-dataset', 16, 12)
+    player_events = events[events['player'] == BENCH_PLAYER]
+
+    fitted = calculate_xT(player_events, name)
+    assert fitted == pytest.approx(calculate_xT(compute_xT(player_events, name)))
+    assert fitted != pytest.approx(calculate_xT(player_events))
@@ -0,0 +1,130 @@
+# thumbnails.py
+"""Pre-generated player photo derivatives for the sticker album.
+
+Build them with ``python thumbnails.py``; the app then serves the encoded
+bytes listed in the manifest and only decodes the original JPEG when a
+derivative is missing. Pillow is imported only on that fallback path, so the
+home page does not pay for it.
+"""
+import argparse
+import json
+import os
+from functools import lru_cache
+from io import BytesIO
+
+
+IMAGES_DIR = 'images'
+DERIVED_DIR = os.path.join(IMAGES_DIR, 'derived')
+MANIFEST_FILE = 'manifest.json'
+
+# Tamanho final e proporção de cada derivado
+THUMBNAIL_SIZES = {
+    'card': ((240, 400), 3/5),
+    'profile': ((300, 500), 3/5),
+}
+THUMBNAIL_FORMATS = {
+    'webp': {'format': 'WEBP', 'quality': 85, 'method': 4},
+    'jpeg': {'format': 'JPEG', 'quality': 85, 'optimize': True, 'progressive': True},
+}
+
+
+def crop_and_resize(img, final_size, aspect_ratio):
+    # Corte centralizado na proporção desejada, depois redimensiona
+    from PIL import Image
+
+    width, height = img.size
+
+    if width / height > aspect_ratio:
+        new_width = int(height * aspect_ratio)
+        new_height = height
+    else:
+        new_width = width
+        new_height = int(width / aspect_ratio)
+
+    left = (width - new_width) / 2
+    top = (height - new_height) / 2
+    right = (width + new_width) / 2
+    bottom = (height + new_height) / 2
+
+    img = img.crop((left, top, right, bottom))
+    return img.resize(final_size, Image.LANCZOS)
+
+
+def encode_image(img, fmt='jpeg'):
+    buf = BytesIO()
+    img.convert('RGB').save(buf, **THUMBNAIL_FORMATS[fmt])
+    return buf.getvalue()
+
+
+def build_thumbnails(images_dir=IMAGES_DIR, derived_dir=DERIVED_DIR, formats=('webp', 'jpeg')):
+    """Write every size/format derivative of the photos in images_dir and a manifest."""
+    from PIL import Image
+
+    os.makedirs(derived_dir, exist_ok=True)
+    manifest = {}
+
+    for file_name in sorted(os.listdir(images_dir)):
+        player_name, ext = os.path.splitext(file_name)
+        if ext.lower() not in ('.jpg', '.jpeg', '.png'):
+            continue
+
+        with Image.open(os.path.join(images_dir, file_name)) as img:
+            img.load()
+            entries = {}
+            for size, (final_size, aspect_ratio) in THUMBNAIL_SIZES.items():
+                thumbnail = crop_and_resize(img, final_size, aspect_ratio)
+                files = {}
+                for fmt in formats:
+                    derived_name = f"{player_name}-{size}.{fmt}"
+                    with open(os.path.join(derived_dir, derived_name), 'wb') as f:
+                        f.write(encode_image(thumbnail, fmt))
+                    files[fmt] = derived_name
+                entries[size] = files
+        manifest[player_name] = entries
+
+    with open(os.path.join(derived_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+    load_manifest.cache_clear()
+    return manifest
+
+
+@lru_cache(maxsize=None)
+def load_manifest(derived_dir=DERIVED_DIR):
+    try:
+        with open(os.path.join(derived_dir, MANIFEST_FILE), encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def load_thumbnail(player_name, size='card', fmt='webp', images_dir=IMAGES_DIR, derived_dir=DERIVED_DIR):
+    """Encoded bytes of a player's photo at one of THUMBNAIL_SIZES."""
+    derived_name = load_manifest(derived_dir).get(player_name, {}).get(size, {}).get(fmt)
+    if derived_name:
+        try:
+            with open(os.path.join(derived_dir, derived_name), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            pass
+
+    from PIL import Image
+
+    # Sem derivado: decodifica o original em modo rascunho (o decodificador
+    # JPEG reduz a escala direto no DCT) e gera a miniatura na hora
+    final_size, aspect_ratio = THUMBNAIL_SIZES[size]
+    with Image.open(os.path.join(images_dir, f"{player_name}.jpg")) as img:
+        img.draft('RGB', final_size)
+        thumbnail = crop_and_resize(img, final_size, aspect_ratio)
+    return encode_image(thumbnail, fmt)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Pre-generate player photo thumbnails.")
+    parser.add_argument('--images-dir', default=IMAGES_DIR)
+    parser.add_argument('--derived-dir', default=DERIVED_DIR)
+    parser.add_argument('--formats', nargs='+', default=['webp', 'jpeg'], choices=sorted(THUMBNAIL_FORMATS))
+    args = parser.parse_args()
+
+    manifest = build_thumbnails(args.images_dir, args.derived_dir, tuple(args.formats))
+    print(f"Wrote {len(manifest)} players to {args.derived_dir}")
@@ -1,41 +1,30 @@
 # utils.py
-from statsbombpy import sb
 import pandas as pd
-from mplsoccer import VerticalPitch as Pitch
 from PIL import Image
-import requests
 from io import BytesIO
 import numpy as np
 import streamlit as st
-
-
-def load_and_resize_image_url(image_url, final_size=(128, 160), aspect_ratio=4/5):
-    # Faz o download da imagem a partir do URL
-    response = requests.get(image_url)
-    img = Image.open(BytesIO(response.content))
-
-    # Resto do código permanece o mesmo
-    width, height = img.size
-
-    # Calcula a nova largura e altura mantendo a proporção desejada
-    if width / height > aspect_ratio:
-        new_width = int(height * aspect_ratio)
-        new_height = height
-    else:
-        new_width = width
-        new_height = int(width / aspect_ratio)
-
-    # Calcula as coordenadas para o corte centralizado
-    left = (width - new_width) / 2
-    top = (height - new_height) / 2
-    right = (width + new_width) / 2
-    bottom = (height + new_height) / 2
-
-    # Recorta e redimensiona a imagem
-    img = img.crop((left, top, right, bottom))
-    img = img.resize(final_size, Image.LANCZOS)
-
-    return img
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+import json
+import os
+from event_store import default_store
+import data_sources
+import remote_images
+from thumbnails import crop_and_resize
+from telemetry import span
+from pitch_plots import (DEFAULT_PITCH, RECEPTION_PITCH, draw_carries, draw_passes, draw_reception_actions,
+                         draw_shots)
+
+
+def load_and_resize_image_url(image_url, final_size=(128, 160), aspect_ratio=4/5, loader=None):
+    # Faz o download da imagem a partir do URL (sessão compartilhada + cache em disco)
+    loader = loader or remote_images.default_loader
+    img = Image.open(BytesIO(loader.fetch(image_url)))
+
+    return crop_and_resize(img, final_size, aspect_ratio)
 
 def set_light_mode():
     st.markdown(
@@ -91,65 +80,229 @@ def set_light_mode():
     )
 
 
-def calculate_xA(events, player_name):
-    # Filtra os eventos do jogador e encontra as assistências de chute
-    player_events = events[events['player'] == player_name]
-    
-    xA_value = (
-        events.loc[np.clip(player_events.index + 1, 0, len(events) - 1), 'shot_statsbomb_xg'].fillna(0).sum() +
-        events.loc[np.clip(player_events.index + 2, 0, len(events) - 1), 'shot_statsbomb_xg'].fillna(0).sum()
-    )
+def calculate_xA_by_player(events):
+    """xA of every player, joining shots to the pass that set them up.
 
+    Uses StatsBomb's shot_key_pass_id -> pass id link, so only the actual
+    key pass is credited, whatever the order of the rows.
+    """
+    if 'shot_key_pass_id' not in events:
+        return pd.Series(dtype=float, name='xA')
 
-    return xA_value
+    shots = events.loc[events['type'] == 'Shot', ['shot_key_pass_id', 'shot_statsbomb_xg']]
+    shots = shots.dropna(subset=['shot_key_pass_id'])
+    passes = events.loc[events['type'] == 'Pass', ['id', 'player']]
 
+    key_passes = shots.merge(passes, left_on='shot_key_pass_id', right_on='id', how='inner')
+    xA = key_passes.groupby('player', observed=True)['shot_statsbomb_xg'].sum()
+    return xA.rename('xA')
 
-def calculate_xT(player_events):
-    
-    
 
-    xt_url = 'https://karun.in/blog/data/open_xt_12x8_v1.json'
-    
- 
-    response = requests.get(xt_url)
-    xt_grid = np.array(response.json())
-
-    def get_xt_value(x, y, xt_grid):
-        grid_x = min(int(x / (120 / 12)), 11)
-        grid_y = min(int(y / (80 / 8)), 7)
-        return xt_grid[grid_y, grid_x]
-    
+def calculate_xA(events, player_name, xA_by_player=None):
+    if xA_by_player is None:
+        xA_by_player = calculate_xA_by_player(events)
 
-    player_events['xT_start'] = np.nan
-    player_events['xT_end'] = np.nan
-    player_events['xT_delta'] = np.nan
-    
+    return np.float64(xA_by_player.get(player_name, 0.0))
 
-    for idx, event in player_events.iterrows():
-        if (event['type'] == 'Carry') or (pd.isna(event.get('pass_outcome')) and event['type'] == 'Pass'):
 
-            start_location = event['location']
-            end_location = event['pass_end_location'] if event['type'] == 'Pass' else event['carry_end_location']
-    
+# Grade aberta de xT de Karun Singh (https://karun.in/blog/data/open_xt_12x8_v1.json),
+# distribuída junto com o projeto em data/
+XT_GRID_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+DEFAULT_XT_GRID = 'open_xt_12x8_v1'
 
-            if start_location and end_location:
-                x_start, y_start = start_location
-                x_end, y_end = end_location
+_xt_grid_loaders = {}
 
-                xT_start = get_xt_value(x_start, y_start, xt_grid)
-                xT_end = get_xt_value(x_end, y_end, xt_grid)
-                xT_delta = xT_end - xT_start
-    
-                # Atualizar o DataFrame
-                player_events.at[idx, 'xT_start'] = xT_start
-                player_events.at[idx, 'xT_end'] = xT_end
-                player_events.at[idx, 'xT_delta'] = xT_delta
-    
+
+def register_xt_grid_loader(name, loader):
+    """Register a callable returning an (n_rows, n_cols) xT grid under name.
+
+    The grid is cached by load_xt_grid like the bundled one, so grids at
+    other resolutions (16x12, 24x16, ...) are loaded once per process.
+    """
+    _xt_grid_loaders[name] = loader
+    load_xt_grid.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def load_xt_grid(name=DEFAULT_XT_GRID):
+    loader = _xt_grid_loaders.get(name)
+    if loader is not None:
+        grid = loader()
+    else:
+        with open(os.path.join(XT_GRID_DIR, f"{name}.json")) as f:
+            grid = json.load(f)
+
+    # Array compartilhado entre sessões: somente leitura
+    grid = np.array(grid, dtype=float)
+    grid.setflags(write=False)
+    return grid
+
+
+def get_xt_values(x, y, xt_grid):
+    # Converte coordenadas StatsBomb (120x80) em células da grade, tudo de uma vez
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n_rows, n_cols = xt_grid.shape
+
+    valid = ~(np.isnan(x) | np.isnan(y))
+    grid_x = np.clip((np.where(valid, x, 0) / (120 / n_cols)).astype(int), 0, n_cols - 1)
+    grid_y = np.clip((np.where(valid, y, 0) / (80 / n_rows)).astype(int), 0, n_rows - 1)
+
+    return np.where(valid, xt_grid[grid_y, grid_x], np.nan)
+
+
+def location_xy(locations):
+    # Separa uma coluna de listas [x, y] em dois arrays (NaN onde não há local)
+    xy = np.full((len(locations), 2), np.nan)
+    has_location = np.fromiter(
+        (isinstance(loc, (list, tuple, np.ndarray)) and len(loc) >= 2 for loc in locations),
+        dtype=bool, count=len(locations)
+    )
+    if has_location.any():
+        xy[has_location] = [loc[:2] for loc, ok in zip(locations, has_location) if ok]
+    return xy[:, 0], xy[:, 1]
+
+
+def event_xy(events, column):
+    # Usa as colunas float32 de normalize_events quando existirem
+    if f"{column}_x" in events:
+        return events[f"{column}_x"].to_numpy(dtype=float), events[f"{column}_y"].to_numpy(dtype=float)
+    if column in events:
+        return location_xy(events[column])
+    return np.full(len(events), np.nan), np.full(len(events), np.nan)
+
+
+# Colunas que o app realmente usa do retorno de sb.events
+EVENT_COLUMNS = [
+    'id', 'index', 'match_id', 'period', 'minute', 'second', 'team', 'player', 'type',
+    'location', 'pass_end_location', 'pass_outcome', 'pass_goal_assist',
+    'carry_end_location', 'shot_outcome', 'shot_statsbomb_xg', 'shot_key_pass_id',
+]
+CATEGORY_COLUMNS = ['type', 'player', 'team', 'pass_outcome', 'shot_outcome']
+LOCATION_COLUMNS = ['location', 'pass_end_location', 'carry_end_location']
+
+
+def normalize_events(events):
+    """Compact copy of the flattened events with only the columns the app uses.
+
+    Text columns become categoricals and each location list is split into
+    float32 <column>_x / <column>_y columns.
+    """
+    columns = [col for col in EVENT_COLUMNS if col in events]
+    compact = pd.DataFrame(index=events.index)
+
+    for col in columns:
+        values = events[col]
+        if col in LOCATION_COLUMNS:
+            x, y = location_xy(values)
+            compact[f"{col}_x"] = x.astype(np.float32)
+            compact[f"{col}_y"] = y.astype(np.float32)
+        elif col in CATEGORY_COLUMNS:
+            compact[col] = values.astype('category')
+        elif col == 'pass_goal_assist':
+            compact[col] = (values == True).to_numpy(dtype=bool)
+        elif col in ('index', 'match_id', 'period', 'minute', 'second'):
+            compact[col] = pd.to_numeric(values, downcast='integer')
+        else:
+            compact[col] = values
+
+    return compact
+
+
+def compute_xT(events, xt_grid=None):
+    """Return a copy of events with xT_start, xT_end and xT_delta columns.
+
+    Only successful passes and carries are scored; works on a single player's
+    events or on the whole competition table. xt_grid may be an array or the
+    name of a grid known to load_xt_grid.
+    """
+    if xt_grid is None:
+        xt_grid = load_xt_grid()
+    elif isinstance(xt_grid, str):
+        xt_grid = load_xt_grid(xt_grid)
+
+    n = len(events)
+    is_pass = (events['type'] == 'Pass').to_numpy(dtype=bool)
+    is_carry = (events['type'] == 'Carry').to_numpy(dtype=bool)
+    if 'pass_outcome' in events:
+        is_pass = is_pass & events['pass_outcome'].isna().to_numpy()
+    scored = is_pass | is_carry
+
+    xT_start = np.full(n, np.nan)
+    xT_end = np.full(n, np.nan)
+    if scored.any():
+        rows = events[scored]
+        pass_rows = is_pass[scored]
+        x_start, y_start = event_xy(rows, 'location')
+        pass_x, pass_y = event_xy(rows, 'pass_end_location')
+        carry_x, carry_y = event_xy(rows, 'carry_end_location')
+        x_end = np.where(pass_rows, pass_x, carry_x)
+        y_end = np.where(pass_rows, pass_y, carry_y)
+
+        xT_start[scored] = get_xt_values(x_start, y_start, xt_grid)
+        xT_end[scored] = get_xt_values(x_end, y_end, xt_grid)
+
+    return events.assign(xT_start=xT_start, xT_end=xT_end, xT_delta=xT_end - xT_start)
+
+
+def calculate_xT(player_events, xt_grid=None):
+    # Com uma grade explícita, eventos já pontuados são pontuados de novo com ela
+    if xt_grid is not None or 'xT_delta' not in player_events:
+        player_events = compute_xT(player_events, xt_grid)
 
     xt_passes = player_events[player_events['type'] == 'Pass']['xT_delta'].fillna(0).sum()
-    xt_carries = player_events[player_events['type'].isin(['Carry'])]['xT_delta'].fillna(0).sum()
-    
-    return xt_passes,xt_carries
+    xt_carries = player_events[player_events['type'] == 'Carry']['xT_delta'].fillna(0).sum()
+
+    return xt_passes, xt_carries
+
+def _column(events, name, fill=np.nan):
+    if name in events:
+        return events[name]
+    return pd.Series(fill, index=events.index)
+
+
+def build_player_summary(events, xA_by_player=None):
+    """Profile metrics of every player in events, in one groupby pass.
+
+    Returns a DataFrame indexed by player with matches, passes, assists,
+    shots, goals, xg, xa, xt_pass and xt_carry.
+    """
+    if 'xT_delta' not in events:
+        events = compute_xT(events)
+    if xA_by_player is None:
+        xA_by_player = calculate_xA_by_player(events)
+
+    is_pass = (events['type'] == 'Pass').to_numpy(dtype=bool)
+    is_shot = (events['type'] == 'Shot').to_numpy(dtype=bool)
+    is_carry = (events['type'] == 'Carry').to_numpy(dtype=bool)
+    xT_delta = events['xT_delta'].fillna(0).to_numpy()
+
+    metrics = pd.DataFrame({
+        'player': events['player'],
+        'match_id': events['match_id'],
+        'passes': is_pass,
+        'assists': is_pass & (_column(events, 'pass_goal_assist') == True).to_numpy(dtype=bool),
+        'shots': is_shot,
+        'goals': is_shot & (_column(events, 'shot_outcome') == 'Goal').to_numpy(dtype=bool),
+        'xg': np.where(is_shot, _column(events, 'shot_statsbomb_xg').fillna(0).to_numpy(dtype=float), 0.0),
+        'xt_pass': np.where(is_pass, xT_delta, 0.0),
+        'xt_carry': np.where(is_carry, xT_delta, 0.0),
+    })
+
+    summary = metrics.groupby('player', observed=True).agg(
+        matches=('match_id', 'nunique'),
+        passes=('passes', 'sum'),
+        assists=('assists', 'sum'),
+        shots=('shots', 'sum'),
+        goals=('goals', 'sum'),
+        xg=('xg', 'sum'),
+        xt_pass=('xt_pass', 'sum'),
+        xt_carry=('xt_carry', 'sum'),
+    )
+    summary['xa'] = xA_by_player.reindex(summary.index, fill_value=0.0).to_numpy()
+
+    return summary
+
 
 def crop_figure(fig, height_crop_percent=0.05,width_crop_percent = 0.275):
     # Salvar o gráfico temporariamente em um buffer
@@ -179,59 +332,237 @@ def load_and_resize_image(player_name, final_size=(128, 160), aspect_ratio = 4/5
     
 
     img = Image.open(file_path)
-    
 
-    width, height = img.size
-    
+    return crop_and_resize(img, final_size, aspect_ratio)
 
-    
-    if width / height > aspect_ratio:
 
-        new_width = int(height * aspect_ratio)
-        new_height = height
-    else:
 
-        new_width = width
-        new_height = int(width / aspect_ratio)
-    
 
-    left = (width - new_width) / 2
-    top = (height - new_height) / 2
-    right = (width + new_width) / 2
-    bottom = (height + new_height) / 2
-    
+def get_competitions(source=None):
+    source = source or data_sources.default_source
+    competitions = source.competitions()
+    return competitions
 
-    img = img.crop((left, top, right, bottom))
-    img = img.resize(final_size, Image.LANCZOS)
-    
-    return img
+def get_matches(competition_id, season_id, source=None):
+    source = source or data_sources.default_source
+    matches = source.matches(competition_id, season_id)
+    return matches
 
+def fetch_match_events(match_id, retries=3, backoff=0.5, source=None):
+    source = source or data_sources.default_source
+    # Tenta novamente com espera exponencial em caso de falha de rede
+    for attempt in range(retries + 1):
+        try:
+            return source.events(match_id)
+        except Exception:
+            if attempt == retries:
+                raise
+            time.sleep(backoff * 2 ** attempt)
+
+
+def get_season_matches(competition_id, season_id, refresh=False, store=None, source=None):
+    """Matches of a season, from the store unless refresh asks the source for new matches."""
+    store = default_store if store is None else store
+
+    matches = store.read_matches(competition_id, season_id) if store and not refresh else None
+    if matches is None:
+        matches = get_matches(competition_id, season_id, source)
+        if store:
+            store.write_matches(competition_id, season_id, matches)
+    return matches
 
 
+def get_match_ids(competition_id, season_id, refresh=False, store=None, source=None):
+    return get_season_matches(competition_id, season_id, refresh, store, source)['match_id'].tolist()
+
+
+def match_labels(matches):
+    """{match_id: 'Home 4-1 Away'} for a season's matches table, in date order."""
+    if 'match_date' in matches:
+        matches = matches.sort_values('match_date', kind='stable')
+    labels = {}
+    for match in matches.to_dict('records'):
+        label = f"{match.get('home_team', '?')} vs {match.get('away_team', '?')}"
+        if pd.notna(match.get('home_score')) and pd.notna(match.get('away_score')):
+            label = f"{match['home_team']} {int(match['home_score'])}-{int(match['away_score'])} {match['away_team']}"
+        if isinstance(match.get('competition_stage'), str):
+            label += f" ({match['competition_stage']})"
+        labels[int(match['match_id'])] = label
+    return labels
+
+
+def load_match_events(competition_id, season_id, match_ids, max_workers=8, retries=3, backoff=0.5, store=None, source=None):
+    """{match_id: events} for match_ids, downloading only the matches not in the store."""
+    store = default_store if store is None else store
+
+    events_by_match = {}
+    if store:
+        for match_id in match_ids:
+            cached = store.read_events(competition_id, season_id, match_id)
+            if cached is not None:
+                events_by_match[match_id] = cached
+    missing = [match_id for match_id in match_ids if match_id not in events_by_match]
+
+    # Baixa as partidas em paralelo; o map preserva a ordem das partidas,
+    # então o concat final é determinístico
+    fetch = partial(fetch_match_events, retries=retries, backoff=backoff, source=source)
+    if max_workers > 1 and len(missing) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+            fetched = list(executor.map(fetch, missing))
+    else:
+        fetched = [fetch(match_id) for match_id in missing]
 
-def get_competitions():
-    competitions = sb.competitions()
-    return competitions
+    for match_id, events_df in zip(missing, fetched):
+        if store:
+            store.write_events(competition_id, season_id, match_id, events_df)
+        events_by_match[match_id] = events_df
 
-def get_matches(competition_id, season_id):
-    matches = sb.matches(competition_id=competition_id, season_id=season_id)
-    return matches
+    return events_by_match
 
-def get_events_competition(competition_id, season_id):
-    matches = get_matches(competition_id, season_id)
-    events_list = []
 
-    for _, match in matches.iterrows():
-        events_df = sb.events(match_id=match['match_id'], flatten_attrs=True)
- 
-        events_list.append(events_df)
+def get_events_competition(competition_id, season_id, max_workers=8, retries=3, backoff=0.5, store=None, source=None, refresh=False):
+    match_ids = get_match_ids(competition_id, season_id, refresh, store, source)
+    events_by_match = load_match_events(competition_id, season_id, match_ids, max_workers, retries, backoff, store, source)
+    events_list = [events_by_match[match_id] for match_id in match_ids]
 
     if events_list:
         all_events = pd.concat(events_list).reset_index()
         return all_events
     else:
         return pd.DataFrame()
-def get_player_events_competition(events, player_name):
+
+
+def concat_events(frames):
+    """Concatenate normalized per-match frames, keeping the categorical columns."""
+    if not frames:
+        return pd.DataFrame()
+    events = pd.concat(frames, ignore_index=True)
+    # Categorias diferentes entre partidas viram object no concat
+    for col in CATEGORY_COLUMNS:
+        if col in events and not isinstance(events[col].dtype, pd.CategoricalDtype):
+            events[col] = events[col].astype('category')
+    return events
+
+
+class MatchEventsCache:
+    """Normalized, xT-scored events per match, shared by every view built from them.
+
+    A season (or any set of matches) is assembled from these pieces, so a
+    new match costs one download and one match's worth of scoring.
+    """
+
+    def __init__(self, xt_grid=None, store=None, source=None, max_workers=8):
+        self.xt_grid = xt_grid
+        self.store = store
+        self.source = source
+        self.max_workers = max_workers
+        self._matches = {}
+        self._lock = threading.Lock()
+
+    def get(self, competition_id, season_id, match_ids):
+        """Scored events of match_ids, in that order."""
+        with self._lock:
+            missing = [m for m in match_ids if (competition_id, season_id, m) not in self._matches]
+        if missing:
+            with span('fetch_events', matches=len(missing)):
+                raw = load_match_events(competition_id, season_id, missing, self.max_workers,
+                                        store=self.store, source=self.source)
+            with span('normalize_events', matches=len(missing)):
+                normalized = {m: normalize_events(raw[m]) for m in missing}
+            with span('compute_xT', matches=len(missing)):
+                scored = {m: compute_xT(events, self.xt_grid) for m, events in normalized.items()}
+            with self._lock:
+                for match_id, events in scored.items():
+                    self._matches[(competition_id, season_id, match_id)] = events
+        with self._lock:
+            return [self._matches[(competition_id, season_id, m)] for m in match_ids]
+
+    def events(self, competition_id, season_id, match_ids):
+        """One events table for match_ids, assembled from the cached matches."""
+        return concat_events(self.get(competition_id, season_id, match_ids))
+
+    def __len__(self):
+        with self._lock:
+            return len(self._matches)
+
+
+class EventIndex:
+    """One events table sorted by (match_id, player, index), with row ranges.
+
+    Built once per loaded events table and holding its only re-sorted copy:
+    a match and a player's match are positional slices (no copy); a
+    player's season is a take of their precomputed row positions instead of
+    a string comparison over the whole table. The player sits between match
+    and event index in the sort key so that a player's events in a match are
+    contiguous; within that range they keep the event order.
+    """
+
+    def __init__(self, events):
+        players = events['player'].astype('category').cat
+        codes = players.codes.to_numpy()
+        match_ids = events['match_id'].to_numpy()
+        order = np.lexsort((events['index'].to_numpy(), codes, match_ids))
+
+        self.events = events.iloc[order]
+        match_ids, codes = match_ids[order], codes[order]
+        n = len(order)
+        categories = players.categories
+
+        # Início de cada partida e de cada (partida, jogador) na tabela ordenada
+        new_match = np.concatenate(([True], match_ids[1:] != match_ids[:-1]))[:n]
+        new_player = new_match | np.concatenate(([True], codes[1:] != codes[:-1]))[:n]
+
+        starts = np.flatnonzero(new_match)
+        stops = np.append(starts[1:], n)
+        self.match_offsets = {int(match_ids[start]): (start, stop) for start, stop in zip(starts, stops)}
+
+        starts = np.flatnonzero(new_player)
+        stops = np.append(starts[1:], n)
+        # Eventos sem jogador (código -1) só aparecem na fatia da partida
+        self.offsets = {
+            (int(match_ids[start]), categories[codes[start]]): (start, stop)
+            for start, stop in zip(starts, stops) if codes[start] >= 0
+        }
+
+        # Posições de cada jogador na tabela ordenada, em ordem de partida e evento
+        by_player = np.argsort(codes, kind='stable')
+        bounds = np.searchsorted(codes[by_player], np.arange(len(categories) + 1))
+        self.player_rows = {
+            player: by_player[bounds[i]:bounds[i + 1]] for i, player in enumerate(categories)
+        }
+
+    def match(self, match_id):
+        start, stop = self.match_offsets.get(match_id, (0, 0))
+        return self.events.iloc[start:stop]
+
+    def player(self, player_name):
+        return self.events.iloc[self.rows(player_name)]
+
+    def player_in_match(self, match_id, player_name):
+        start, stop = self.offsets.get((match_id, player_name), (0, 0))
+        return self.events.iloc[start:stop]
+
+    def rows(self, player_name):
+        """Positions of player_name's rows in the sorted table."""
+        return self.player_rows.get(player_name, np.empty(0, dtype=np.intp))
+
+    def players(self):
+        return list(self.player_rows)
+
+    def matches(self, player_name=None):
+        """Match ids in the table, or those where player_name has events."""
+        if player_name is None:
+            return list(self.match_offsets)
+        return [match_id for match_id, player in self.offsets if player == player_name]
+
+
+def build_event_index(events):
+    return EventIndex(events)
+
+
+def get_player_events_competition(events, player_name, index=None):
+    if index is not None:
+        return index.player(player_name)
 
     player_events = events[events['player'] == player_name]
 
@@ -239,128 +570,138 @@ def get_player_events_competition(events, player_name):
     return player_events
 
 
-def plot_passes(events_df, title=''):
-    pitch = Pitch()
-    fig, ax = pitch.draw()
+def pass_rows(events_df):
+    return (events_df['type'] == 'Pass') & (events_df['pass_outcome'].isna())
 
-    passes = events_df[(events_df['type'] == 'Pass') & (events_df['pass_outcome'].isna())]
 
-    if passes.empty:
-        return fig
+def carry_rows(events_df):
+    return events_df['type'] == 'Carry'
 
-    pass_start_x = passes['location'].apply(lambda loc: loc[0])
-    pass_start_y = passes['location'].apply(lambda loc: loc[1])
-    pass_end_x = passes['pass_end_location'].apply(lambda loc: loc[0])
-    pass_end_y = passes['pass_end_location'].apply(lambda loc: loc[1])
-    
-    pitch.arrows(pass_start_x, pass_start_y, pass_end_x, pass_end_y, ax=ax, width=1,  color='black', alpha = 0.2)
-    
-    key_passes = passes[(passes['xT_delta'] >= 0.05)]
-    
-    if key_passes.empty:
-        return fig
-    pass_start_x = key_passes['location'].apply(lambda loc: loc[0])
-    pass_start_y = key_passes['location'].apply(lambda loc: loc[1])
-    pass_end_x = key_passes['pass_end_location'].apply(lambda loc: loc[0])
-    pass_end_y = key_passes['pass_end_location'].apply(lambda loc: loc[1])
-    
-    pitch.arrows(pass_start_x, pass_start_y, pass_end_x, pass_end_y, ax=ax, width=2,  color='black', alpha = 0.8)
-    ax.set_title(title)
 
-    return fig
+def reception_rows(events_df):
+    reception_types = ['Ball Receipt*']
+    return events_df['type'].isin(reception_types)
 
-def plot_carries(events_df, title=''):
-    pitch = Pitch(pitch_type='statsbomb')
-    fig, ax = pitch.draw()
 
-    carries = events_df[events_df['type'] == 'Carry']
+def shot_rows(events_df):
+    return events_df['type'] == 'Shot'
 
-    if carries.empty:
-        return fig
 
-    carry_start_x = carries['location'].apply(lambda loc: loc[0])
-    carry_start_y = carries['location'].apply(lambda loc: loc[1])
-    carry_end_x = carries['carry_end_location'].apply(lambda loc: loc[0])
-    carry_end_y = carries['carry_end_location'].apply(lambda loc: loc[1])
+def _arrows_data(events, end_column, key_threshold):
+    x, y = event_xy(events, 'location')
+    end_x, end_y = event_xy(events, end_column)
+    key = (events['xT_delta'] >= key_threshold).to_numpy(dtype=bool)
+    return {'x': x, 'y': y, 'end_x': end_x, 'end_y': end_y, 'key': key}
 
-    pitch.arrows(carry_start_x, carry_start_y, carry_end_x, carry_end_y, ax=ax, width=1.5, color='black', alpha = 0.2)
-    
-    
-    key_carries = carries[carries['xT_delta'] >= 0.025]
-    if key_carries.empty:
-        return fig
-    carry_start_x = key_carries['location'].apply(lambda loc: loc[0])
-    carry_start_y = key_carries['location'].apply(lambda loc: loc[1])
-    carry_end_x = key_carries['carry_end_location'].apply(lambda loc: loc[0])
-    carry_end_y = key_carries['carry_end_location'].apply(lambda loc: loc[1])
-    
-    pitch.arrows(carry_start_x, carry_start_y, carry_end_x, carry_end_y, ax=ax, width=2,  color='black', alpha = 0.8)
-    ax.set_title(title)
 
-    return fig
+def _points_data(events):
+    x, y = event_xy(events, 'location')
+    return {'x': x, 'y': y}
 
 
+def _shots_data(shots):
+    x, y = event_xy(shots, 'location')
+    return {
+        'x': x,
+        'y': y,
+        'xg': shots['shot_statsbomb_xg'].to_numpy(dtype=float),
+        'goal': (shots['shot_outcome'] == 'Goal').to_numpy(dtype=bool),
+    }
 
 
-def plot_reception_actions(events_df, title=''):
+# Linhas e coordenadas de cada gráfico do perfil. Passes e conduções-chave
+# são as que ganham pelo menos 0.05 / 0.025 de xT
+PLOT_DATA = {
+    'receipts': (reception_rows, _points_data),
+    'carries': (carry_rows, partial(_arrows_data, end_column='carry_end_location', key_threshold=0.025)),
+    'passes': (pass_rows, partial(_arrows_data, end_column='pass_end_location', key_threshold=0.05)),
+    'shots': (shot_rows, _shots_data),
+}
 
-    pitch = Pitch(line_zorder=2)
 
-    fig, ax = pitch.draw()
+def _plot_data(plot_name, events_df):
+    rows, coordinates = PLOT_DATA[plot_name]
+    return coordinates(events_df[rows(events_df)])
 
 
-    reception_types = ['Ball Receipt*']
-    reception_events = events_df[events_df['type'].isin(reception_types)]
+def passes_data(events_df):
+    """Start/end coordinates of the successful passes, flagging the key ones."""
+    return _plot_data('passes', events_df)
 
-    if reception_events.empty:
-        return fig
 
+def carries_data(events_df):
+    """Start/end coordinates of the carries, flagging the key ones."""
+    return _plot_data('carries', events_df)
 
-    x = reception_events['location'].apply(lambda loc: loc[0])
-    y = reception_events['location'].apply(lambda loc: loc[1])
 
+def reception_data(events_df):
+    return _plot_data('receipts', events_df)
 
-    x = np.array(x)
-    y = np.array(y)
 
+def shots_data(events_df):
+    return _plot_data('shots', events_df)
 
-    pitch.kdeplot(x, y, ax=ax, cmap='Greys', alpha=1, thresh=0.5, shade=True,
-                  levels=100, n_levels=10, cut=1, zorder=1, fill=True)
 
-    ax.set_title(title)
-    return fig
+def plot_data(events_df):
+    """Coordinates of every profile plot, keyed like PLOT_DATA."""
+    return {plot_name: _plot_data(plot_name, events_df) for plot_name in PLOT_DATA}
 
 
+def plot_data_by_player(events, player_names, index=None):
+    """plot_data of several players at once: {player: {plot: coordinates}}.
 
-def plot_shots(events_df, title=''):
-    pitch = Pitch()
-    fig, ax = pitch.draw()
+    The players' rows are gathered with one take from the event index and
+    each plot's rows are filtered and extracted once for all of them; the
+    arrays are then split at the player boundaries.
+    """
+    index = index if index is not None else build_event_index(events)
+    player_names = list(dict.fromkeys(player_names))
+    player_rows = [index.rows(player_name) for player_name in player_names]
+    selected = index.events.iloc[np.concatenate(player_rows + [np.empty(0, dtype=np.intp)])]
+    bounds = np.cumsum([0] + [len(rows) for rows in player_rows])
 
-    shots = events_df[events_df['type'] == 'Shot']
+    by_player = {player_name: {} for player_name in player_names}
+    for plot_name, (plot_rows, coordinates) in PLOT_DATA.items():
+        mask = plot_rows(selected).to_numpy(dtype=bool)
+        data = coordinates(selected[mask])
+        # Posição de cada fronteira de jogador dentro das linhas filtradas
+        splits = np.concatenate(([0], np.cumsum(mask)))[bounds]
+        for i, player_name in enumerate(player_names):
+            by_player[player_name][plot_name] = {
+                key: values[splits[i]:splits[i + 1]] for key, values in data.items()
+            }
+    return by_player
 
-    if shots.empty:
-        return fig
 
+def compare_players(events, player_names, index=None, xA_by_player=None):
+    """(summary, plot data) of several players (repeats ignored), in one pass over their events.
 
-    goals = shots[shots['shot_outcome'] == 'Goal']
-    non_goals = shots[shots['shot_outcome'] != 'Goal']
+    summary is build_player_summary restricted to player_names (in that
+    order); xA is computed on the full table, since a player's key passes
+    lead to other players' shots.
+    """
+    index = index if index is not None else build_event_index(events)
+    player_names = list(dict.fromkeys(player_names))
+    if xA_by_player is None:
+        xA_by_player = calculate_xA_by_player(events)
+    player_events = index.events.iloc[np.concatenate([index.rows(name) for name in player_names] + [np.empty(0, dtype=np.intp)])]
+    summary = build_player_summary(player_events, xA_by_player)
+    summary = summary.reindex([name for name in player_names if name in summary.index])
+    return summary, plot_data_by_player(events, player_names, index)
 
 
+def plot_passes(events_df, title='', ax=None):
+    return draw_passes(passes_data(events_df), title, ax)
 
-    if not non_goals.empty:
-        non_goal_x = non_goals['location'].apply(lambda loc: loc[0])
-        non_goal_y = non_goals['location'].apply(lambda loc: loc[1])
-        non_goal_s = non_goals['shot_statsbomb_xg'].apply(lambda x: max(x, 0.075)*250)
-        pitch.scatter(non_goal_x, non_goal_y, ax=ax, edgecolors='black', c='black', s=non_goal_s, alpha = 0.25)
 
+def plot_carries(events_df, title='', ax=None):
+    return draw_carries(carries_data(events_df), title, ax)
 
-    if not goals.empty:
-        goal_x = goals['location'].apply(lambda loc: loc[0])
-        goal_y = goals['location'].apply(lambda loc: loc[1])
-        goal_s = goals['shot_statsbomb_xg'].apply(lambda x: max(x, 0.075)*250)
-        pitch.scatter(goal_x, goal_y, ax=ax, edgecolors='black', c='black', s=goal_s, alpha = 1)
 
-    ax.set_title(title)
+def plot_reception_actions(events_df, title='', mode='fast', bins=(120, 80), sigma=4, thresh=0.5, ax=None):
+    """Density of a player's ball receipts (see pitch_plots.draw_reception_actions)."""
+    return draw_reception_actions(reception_data(events_df), title, mode, bins, sigma, thresh, ax)
 
 
-    return fig
\ No newline at end of file
+def plot_shots(events_df, title='', ax=None):
+    return draw_shots(shots_data(events_df), title, ax)
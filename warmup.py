@@ -0,0 +1,60 @@
+# warmup.py
+import logging
+import os
+import threading
+import time
+
+
+WARMUP_ENABLED = os.environ.get('BRASIL70_WARMUP', '').lower() in ('1', 'true', 'yes')
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundWarmUp:
+    """Run a loading function once on a background thread and expose its state.
+
+    state is 'idle', 'running', 'ready' or 'failed'. Callers that need the
+    data while it is loading wait() on the in-flight run instead of starting
+    their own.
+    """
+
+    def __init__(self, target, name='warm-up'):
+        self.target = target
+        self.name = name
+        self.state = 'idle'
+        self.error = None
+        self.duration = None
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self.state != 'idle':
+                return self
+            self.state = 'running'
+        threading.Thread(target=self._run, name=self.name, daemon=True).start()
+        return self
+
+    def _run(self):
+        start = time.perf_counter()
+        try:
+            self.target()
+            self.state = 'ready'
+        except Exception as e:
+            # A página volta a carregar os dados por conta própria
+            self.error = e
+            self.state = 'failed'
+            logger.exception("%s failed", self.name)
+        finally:
+            self.duration = time.perf_counter() - start
+            self._done.set()
+            logger.info("%s finished in %.2fs (%s)", self.name, self.duration, self.state)
+
+    def running(self):
+        return self.state == 'running'
+
+    def wait(self, timeout=None):
+        """Block until the run finishes (or timeout); returns the state."""
+        if self.state != 'idle':
+            self._done.wait(timeout)
+        return self.state
@@ -0,0 +1,173 @@
+# xt_model.py
+"""Fit expected threat (xT) grids from event data.
+
+The model is Karun Singh's: on each cell of an n_cols x n_rows pitch grid
+a player either shoots (scoring with the cell's goal probability) or moves
+the ball with a pass or carry, and the value of a cell is solved by value
+iteration over the move transition matrix:
+
+    xT = shoot * goal + move * T @ xT
+
+Counts are binned with np.bincount and the transition matrix is kept
+sparse, as (start cell, end cell, probability) arrays, so fitting a 48x32
+grid on a season costs about as much as a 12x8 one.
+
+A fitted grid is registered in utils' xT grids under a name made of the
+dataset and the grid size, so compute_xT(events, name),
+calculate_xT(events, name) (which rescores events already scored with
+another grid) and MatchEventsCache(xt_grid=name) use it like the bundled
+grid. Written to data/, it is available by name in any process:
+
+    python xt_model.py --grid 16x12
+"""
+import argparse
+import json
+import os
+import threading
+
+import numpy as np
+
+from utils import XT_GRID_DIR, event_xy, load_xt_grid, register_xt_grid_loader
+
+
+def _cells(x, y, n_cols, n_rows):
+    # Mesma discretização de get_xt_values; -1 onde não há coordenada
+    valid = ~(np.isnan(x) | np.isnan(y))
+    col = np.clip((np.where(valid, x, 0) / (120 / n_cols)).astype(int), 0, n_cols - 1)
+    row = np.clip((np.where(valid, y, 0) / (80 / n_rows)).astype(int), 0, n_rows - 1)
+    return np.where(valid, row * n_cols + col, -1)
+
+
+def _is(events, column, value):
+    if column not in events:
+        return np.zeros(len(events), dtype=bool)
+    return (events[column] == value).to_numpy(dtype=bool)
+
+
+def _has(events, column):
+    if column not in events:
+        return np.zeros(len(events), dtype=bool)
+    return events[column].notna().to_numpy()
+
+
+def _ratio(numerator, denominator):
+    return np.divide(numerator, denominator, out=np.zeros(len(numerator)), where=denominator > 0)
+
+
+def fit_xt_surfaces(events, n_cols=12, n_rows=8, tol=1e-6, max_iter=500):
+    """Shoot, move and goal probabilities, transitions and xT of each cell.
+
+    Works on raw or normalized events (any set of matches). Moves are all
+    passes and carries; only successful ones (no pass_outcome) enter the
+    transition counts, while failed ones still count as moves out of their
+    cell. Grids are (n_rows, n_cols), oriented like load_xt_grid.
+    """
+    n_cells = n_cols * n_rows
+    is_pass = _is(events, 'type', 'Pass')
+    is_carry = _is(events, 'type', 'Carry')
+    is_shot = _is(events, 'type', 'Shot')
+    is_goal = is_shot & _is(events, 'shot_outcome', 'Goal')
+
+    start = _cells(*event_xy(events, 'location'), n_cols, n_rows)
+    pass_x, pass_y = event_xy(events, 'pass_end_location')
+    carry_x, carry_y = event_xy(events, 'carry_end_location')
+    end = _cells(np.where(is_pass, pass_x, carry_x), np.where(is_pass, pass_y, carry_y), n_cols, n_rows)
+
+    moves = (is_pass | is_carry) & (start >= 0)
+    shots = is_shot & (start >= 0)
+    move_count = np.bincount(start[moves], minlength=n_cells)
+    shot_count = np.bincount(start[shots], minlength=n_cells)
+    goal_count = np.bincount(start[shots & is_goal], minlength=n_cells)
+
+    actions = move_count + shot_count
+    shoot = _ratio(shot_count, actions)
+    move = _ratio(move_count, actions)
+    goal = _ratio(goal_count, shot_count)
+
+    # Matriz de transição esparsa: uma entrada por par (início, fim) observado
+    failed = is_pass & _has(events, 'pass_outcome')
+    successful = moves & ~failed & (end >= 0)
+    pairs, counts = np.unique(start[successful] * n_cells + end[successful], return_counts=True)
+    from_cell, to_cell = np.divmod(pairs, n_cells)
+    probability = counts / move_count[from_cell]
+
+    payoff = shoot * goal
+    xt = np.zeros(n_cells)
+    for iterations in range(1, max_iter + 1):
+        # T @ xT sem montar a matriz densa
+        expected_move = np.bincount(from_cell, weights=probability * xt[to_cell], minlength=n_cells)
+        updated = payoff + move * expected_move
+        converged = np.abs(updated - xt).max() < tol
+        xt = updated
+        if converged:
+            break
+
+    shape = (n_rows, n_cols)
+    return {
+        'xt': xt.reshape(shape),
+        'shoot': shoot.reshape(shape),
+        'move': move.reshape(shape),
+        'goal': goal.reshape(shape),
+        'transitions': (from_cell, to_cell, probability),
+        'iterations': iterations,
+    }
+
+
+def fit_xt(events, n_cols=12, n_rows=8, tol=1e-6, max_iter=500):
+    """The fitted (n_rows, n_cols) xT grid of events."""
+    return fit_xt_surfaces(events, n_cols, n_rows, tol, max_iter)['xt']
+
+
+def fitted_xt_grid_name(dataset, n_cols, n_rows):
+    return f"fitted_xt_{dataset}_{n_cols}x{n_rows}"
+
+
+_fitted_grids = set()
+_fit_lock = threading.Lock()
+
+
+def register_fitted_xt_grid(events, dataset, n_cols=12, n_rows=8):
+    """Fit events once per (dataset, grid size) and register the grid; returns its name.
+
+    dataset identifies the events (e.g. profile_config.events_version); later calls
+    with the same dataset and size reuse the grid without looking at events.
+    """
+    name = fitted_xt_grid_name(dataset, n_cols, n_rows)
+    with _fit_lock:
+        if name not in _fitted_grids:
+            grid = fit_xt(events, n_cols, n_rows)
+            register_xt_grid_loader(name, lambda: grid)
+            _fitted_grids.add(name)
+    return name
+
+
+def write_xt_grid(name, grid, out_dir=XT_GRID_DIR):
+    """Write grid as <out_dir>/<name>.json, the format load_xt_grid reads."""
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, f"{name}.json")
+    with open(path, 'w') as f:
+        json.dump(np.round(grid, 6).tolist(), f)
+    return path
+
+
+def _grid_size(value):
+    n_cols, _, n_rows = value.partition('x')
+    return int(n_cols), int(n_rows)
+
+
+if __name__ == '__main__':
+    from profile_config import SEASONS
+    from export_cards import load_season
+
+    parser = argparse.ArgumentParser(description="Fit xT grids from a season's passes, carries and shots.")
+    parser.add_argument('--competition', default=SEASONS[0][0])
+    parser.add_argument('--season', default=SEASONS[0][1])
+    parser.add_argument('--grid', nargs='+', type=_grid_size, default=[(12, 8)], help="sizes as COLSxROWS")
+    parser.add_argument('--out-dir', default=XT_GRID_DIR)
+    args = parser.parse_args()
+
+    event_index, _, version = load_season(args.competition, args.season)
+    for n_cols, n_rows in args.grid:
+        name = register_fitted_xt_grid(event_index.events, version, n_cols, n_rows)
+        path = write_xt_grid(name, load_xt_grid(name), args.out_dir)
+        print(f"Wrote {path}")